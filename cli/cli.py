@@ -8,7 +8,33 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-import core
+# core is imported inside each command branch so that e.g. `list-tags`
+# only loads the modules it needs
+
+# Worker threads used to read snapshot metadata for `list --meta`
+META_READ_WORKERS = 16
+
+
+def _spawn_background_save(tags: list[str], note: str | None) -> None:
+    """Run `save` again in a detached process that outlives this one."""
+    import subprocess
+
+    cmd = [sys.executable, "-m", "cli.cli", "save"]
+    for tag in tags:
+        cmd += ["--tag", tag]
+    if note is not None:
+        cmd += ["--note", note]
+
+    # A new session keeps the copy running after the terminal closes; the
+    # outcome is reported through the log file
+    subprocess.Popen(
+        cmd,
+        cwd=project_root,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 def main() -> None:
@@ -18,6 +44,11 @@ def main() -> None:
     save_p = sub.add_parser("save")
     save_p.add_argument("--tag", action="append", default=[])
     save_p.add_argument("--note")
+    save_p.add_argument(
+        "--background",
+        action="store_true",
+        help="copy the save in a detached process and return immediately",
+    )
 
     list_p = sub.add_parser("list")
     list_p.add_argument("--meta", action="store_true")
@@ -48,7 +79,18 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.cmd == "save":
-        result, message = core.save(args.tag, args.note)
+        if args.background:
+            from core import LOG_FILE
+
+            _spawn_background_save(args.tag, args.note)
+            # `logs` only shows this process's messages, so point at the
+            # file the detached save writes to
+            print(f"✓ Snapshot queued, see {LOG_FILE} for the result")
+            return
+
+        from core import save
+
+        result, message = save(args.tag, args.note)
         if result:
             print(f"✓ {message}")
         else:
@@ -56,22 +98,34 @@ def main() -> None:
             exit(1)
 
     elif args.cmd == "list":
-        for snap in core.list_snapshots():
-            if args.meta:
-                meta = core.read_meta(snap)
-                print(
-                    f"{snap.name} tags={meta.get('tags', [])} note={meta.get('note')}"
-                )
-            else:
+        from core import list_snapshots, read_meta, tags_for_snapshot
+
+        snapshots = list_snapshots()
+        if args.meta:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # meta.json reads are tiny and latency-bound; overlap them
+            with ThreadPoolExecutor(max_workers=META_READ_WORKERS) as pool:
+                metas = pool.map(read_meta, snapshots)
+                for snap, meta in zip(snapshots, metas):
+                    # Tag directories are authoritative; meta.json may be stale
+                    tags = tags_for_snapshot(snap.name) or meta.get('tags', [])
+                    print(f"{snap.name} tags={tags} note={meta.get('note')}")
+        else:
+            for snap in snapshots:
                 print(snap.name)
 
     elif args.cmd == "list-tags":
-        for tag in core.list_tags():
-            count = core.get_tag_count(tag)
+        from core import get_tag_count, list_tags
+
+        for tag in list_tags():
+            count = get_tag_count(tag)
             print(f"{tag} ({count} snapshots)")
 
     elif args.cmd == "restore":
-        result, message = core.restore(core.BACKUP_SAVE_ROOT / args.name)
+        from core import BACKUP_SAVE_ROOT, restore
+
+        result, message = restore(BACKUP_SAVE_ROOT / args.name)
         if result:
             print(f"✓ {message}")
         else:
@@ -79,7 +133,9 @@ def main() -> None:
             exit(1)
 
     elif args.cmd == "restore-tag":
-        result, message = core.restore_by_tag(args.tag)
+        from core import restore_by_tag
+
+        result, message = restore_by_tag(args.tag)
         if result:
             print(f"✓ {message}")
         else:
@@ -87,7 +143,9 @@ def main() -> None:
             exit(1)
 
     elif args.cmd == "rename-tag":
-        result, message = core.rename_tag(args.old, args.new)
+        from core import rename_tag
+
+        result, message = rename_tag(args.old, args.new)
         if result:
             print(f"✓ {message}")
         else:
@@ -95,7 +153,9 @@ def main() -> None:
             exit(1)
 
     elif args.cmd == "delete-tag":
-        result, message = core.delete_tag(args.tag)
+        from core import delete_tag
+
+        result, message = delete_tag(args.tag)
         if result:
             print(f"✓ {message}")
         else:
@@ -103,7 +163,9 @@ def main() -> None:
             exit(1)
 
     elif args.cmd == "merge-tags":
-        result, message = core.merge_tags(args.source, args.target)
+        from core import merge_tags
+
+        result, message = merge_tags(args.source, args.target)
         if result:
             print(f"✓ {message}")
         else:
@@ -111,7 +173,9 @@ def main() -> None:
             exit(1)
 
     elif args.cmd == "logs":
-        logs = core.logger.get_recent_logs(20)
+        from core import logger
+
+        logs = logger.get_recent_logs(20)
         if logs:
             print("Recent logs:")
             for log in logs:
@@ -4,30 +4,57 @@ This module provides all the core functionality for managing Hades game saves,
 including snapshot creation, restoration, tagging, and metadata management.
 """
 
+import importlib
+from typing import Any, List
+
 # Re-export all functions for backward compatibility
-from .config import get_last_tag, set_last_tag
 from .constants import *
+
+# The logger instance shares its name with the core.logger submodule, so it is
+# bound eagerly; otherwise the first submodule import would shadow it
 from .logger import logger
-from .metadata_handler import read_meta, write_meta
-from .snapshot_manager import (
-    assert_game_folder_exist,
-    delete_snapshot,
-    list_snapshots,
-    now_ts,
-    restore,
-    restore_by_tag,
-    save,
-)
-from .tag_manager import (
-    add_tag,
-    delete_tag,
-    get_snapshot_tag,
-    get_tag_count,
-    list_tags,
-    merge_tags,
-    rename_tag,
-    snapshots_for_tag,
-)
+
+# Everything else is imported on first attribute access (PEP 562), so e.g.
+# `from core import list_tags` doesn't pay for the snapshot or metadata code
+_LAZY_ATTRS = {
+    "get_last_tag": "config",
+    "set_last_tag": "config",
+    "read_meta": "metadata_handler",
+    "write_meta": "metadata_handler",
+    "assert_game_folder_exist": "snapshot_manager",
+    "delete_snapshot": "snapshot_manager",
+    "list_snapshots": "snapshot_manager",
+    "now_ts": "snapshot_manager",
+    "restore": "snapshot_manager",
+    "restore_by_tag": "snapshot_manager",
+    "save": "snapshot_manager",
+    "add_tag": "tag_manager",
+    "add_tags": "tag_manager",
+    "create_tag": "tag_manager",
+    "delete_tag": "tag_manager",
+    "get_snapshot_tag": "tag_manager",
+    "get_tag_count": "tag_manager",
+    "list_tags": "tag_manager",
+    "merge_tags": "tag_manager",
+    "rename_tag": "tag_manager",
+    "snapshots_for_tag": "tag_manager",
+    "tags_for_snapshot": "tag_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Constants
@@ -42,6 +69,8 @@ __all__ = [
     "write_meta",
     # Tags
     "add_tag",
+    "add_tags",
+    "create_tag",
     "delete_tag",
     "get_snapshot_tag",
     "get_tag_count",
@@ -49,6 +78,7 @@ __all__ = [
     "merge_tags",
     "rename_tag",
     "snapshots_for_tag",
+    "tags_for_snapshot",
     # Config
     "get_last_tag",
     "set_last_tag",
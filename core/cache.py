@@ -0,0 +1,56 @@
+"""In-process caching of filesystem-derived state.
+
+The filesystem stays the source of truth: every cached value is stored with
+a stamp built from directory mtimes and is only reused while the stamp still
+matches. Mutations made through ``core`` additionally call ``invalidate()``
+so that changes landing within the filesystem's timestamp granularity are
+never missed.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Hashable, Tuple
+
+_generation = 0
+
+# Sentinel returned by StatCache.get on a miss
+MISS = object()
+
+
+def invalidate() -> None:
+    """Invalidate every cache entry created before this call."""
+    global _generation
+    _generation += 1
+
+
+def dir_mtime(path: Path) -> int:
+    """Get a directory's mtime in nanoseconds.
+
+    Args:
+        path: Directory to stat
+
+    Returns:
+        The mtime, or 0 if the directory doesn't exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+class StatCache:
+    """Map keys to values that stay valid while their stamp is unchanged."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Tuple[Tuple[int, Hashable], Any]] = {}
+
+    def get(self, key: Hashable, stamp: Hashable) -> Any:
+        """Get the cached value for key, or MISS if absent or stale."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == (_generation, stamp):
+            return entry[1]
+        return MISS
+
+    def put(self, key: Hashable, stamp: Hashable, value: Any) -> None:
+        """Store value for key under the given stamp."""
+        self._entries[key] = ((_generation, stamp), value)
@@ -4,6 +4,8 @@ import json
 from typing import Optional
 
 from .constants import BACKUP_SAVE_ROOT, CONFIG_FILE
+from .file_ops import ensure_dir
+from .json_io import dump_json, load_json
 
 
 def get_last_tag() -> Optional[str]:
@@ -16,7 +18,7 @@ def get_last_tag() -> Optional[str]:
         return None
 
     try:
-        config = json.loads(CONFIG_FILE.read_text())
+        config = load_json(CONFIG_FILE)
         return config.get("last_tag")
     except (json.JSONDecodeError, KeyError):
         return None
@@ -28,14 +30,19 @@ def set_last_tag(tag: str) -> None:
     Args:
         tag: Tag name to save as last used
     """
-    BACKUP_SAVE_ROOT.mkdir(parents=True, exist_ok=True)
+    ensure_dir(BACKUP_SAVE_ROOT)
 
     config = {}
     if CONFIG_FILE.exists():
         try:
-            config = json.loads(CONFIG_FILE.read_text())
+            config = load_json(CONFIG_FILE)
         except json.JSONDecodeError:
             config = {}
 
     config["last_tag"] = tag
-    CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    try:
+        dump_json(CONFIG_FILE, config)
+    except FileNotFoundError:
+        # The backup root was removed after ensure_dir() first saw it
+        ensure_dir(BACKUP_SAVE_ROOT, recheck=True)
+        dump_json(CONFIG_FILE, config)
@@ -12,6 +12,16 @@ BACKUP_SAVE_ROOT = Path.home() / ".local/share/hades_backups_v2"  # New path to
 CONFIG_FILE = BACKUP_SAVE_ROOT / "config.json"
 LOG_FILE = BACKUP_SAVE_ROOT / "hades.log"
 
+# Directory under the backup root that deleted snapshots are moved into
+# while they are removed in the background
+TRASH_DIR_NAME = ".trash"
+
+# Entries of the backup root that are never tag directories
+RESERVED_NAMES = frozenset({"config.json", "hades.log", "saves", "tags", TRASH_DIR_NAME})
+
+# Snapshot directory names start with a timestamp in this format
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H-%M-%S"
+
 # Application settings
 MAX_LOG_ENTRIES = 50
 ERROR_DISPLAY_DURATION = 10  # frames
@@ -0,0 +1,332 @@
+"""Filesystem helpers for copying Hades save trees."""
+
+import atexit
+import errno
+import os
+import shutil
+import stat
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is POSIX only
+    fcntl = None
+
+# ioctl request number for FICLONE (see linux/fs.h)
+FICLONE = 0x40049409
+
+# errno values meaning the filesystem can't clone and bytes must be copied
+_CLONE_UNSUPPORTED = {
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSOCK,
+}
+
+# Bytes requested per copy_file_range call
+COPY_CHUNK_SIZE = 1 << 20
+
+# Threads used to copy the files of one tree concurrently
+COPY_WORKERS = 8
+
+PathType = Union[str, Path]
+
+# Single background thread deleting trees for remove_tree_later()
+_reaper: Optional[ThreadPoolExecutor] = None
+
+# Trash directories already swept of leftovers by move_to_trash()
+_swept_trash_dirs: Set[Path] = set()
+
+# Directories ensure_dir() has already created or seen this process
+_ensured_dirs: Set[Path] = set()
+
+
+def ensure_dir(path: Path, recheck: bool = False) -> None:
+    """Create a directory (and parents) once per process.
+
+    Only meant for directories the tool never removes, like the backup
+    root; tag directories come and go and must keep using ``mkdir``.
+    Someone can still delete the directory by hand, so callers that get a
+    FileNotFoundError writing into it call this again with ``recheck``.
+
+    Args:
+        path: Directory to create
+        recheck: Create the directory even if it was seen before
+    """
+    if recheck or path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def clone_file(src: PathType, dst: PathType) -> PathType:
+    """Copy a single file, sharing data extents with the source when possible.
+
+    On copy-on-write filesystems (btrfs, xfs) the FICLONE ioctl creates a
+    reflink so no file data is read or written. Otherwise the data is copied
+    in-kernel with ``os.copy_file_range`` in 1 MiB chunks or, failing that,
+    ``os.sendfile``. Anywhere neither is available this falls back to
+    ``shutil.copy2``.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path (``shutil.copytree`` copy_function contract)
+    """
+    if _reflink(src, dst) or _copy_range(src, dst) or _sendfile(src, dst):
+        shutil.copystat(src, dst)
+        return dst
+
+    return shutil.copy2(src, dst)
+
+
+def _reflink(src: PathType, dst: PathType) -> bool:
+    """Clone src into dst with FICLONE, returning False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError as e:
+        if e.errno not in _CLONE_UNSUPPORTED:
+            raise
+        return False
+    return True
+
+
+def _copy_range(src: PathType, dst: PathType) -> bool:
+    """Copy src into dst with copy_file_range, returning False if unsupported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            while True:
+                copied = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE)
+                if not copied:
+                    break
+                offset += copied
+    except OSError as e:
+        if e.errno not in _CLONE_UNSUPPORTED:
+            raise
+        return False
+    # Some filesystems report success while copying nothing, so an empty
+    # result for a non-empty file means the next fallback has to run
+    return offset > 0 or size == 0
+
+
+def _sendfile(src: PathType, dst: PathType) -> bool:
+    """Copy src into dst with sendfile, returning False if unsupported."""
+    if not hasattr(os, "sendfile"):
+        return False
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+        finally:
+            os.close(dst_fd)
+    except OSError as e:
+        if e.errno not in _CLONE_UNSUPPORTED:
+            raise
+        return False
+    finally:
+        os.close(src_fd)
+    # A short copy is left for shutil.copy2 to redo rather than passed off
+    # as complete
+    return offset >= size
+
+
+def remove_tree_later(path: PathType) -> None:
+    """Delete a directory tree on a background thread.
+
+    Callers rename the tree out of the way first, so nothing else sees it
+    while it is being deleted. Pending deletions finish before the
+    interpreter exits.
+
+    Args:
+        path: Directory to delete
+    """
+    global _reaper
+    if _reaper is None:
+        _reaper = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reaper")
+        atexit.register(_reaper.shutdown, wait=True)
+    _reaper.submit(shutil.rmtree, path, ignore_errors=True)
+
+
+def move_to_trash(path: PathType, trash_dir: Path) -> None:
+    """Delete a directory tree by renaming it into trash_dir.
+
+    The rename makes the tree disappear at once; its files are then deleted
+    by the background reaper. The first call for a trash directory also
+    reaps anything left there by an earlier process that exited (or
+    crashed) before finishing.
+
+    Args:
+        path: Directory to delete, on the same filesystem as trash_dir
+        trash_dir: Directory to move it into, created if missing
+
+    Raises:
+        NotADirectoryError: If path is not a directory; the reaper can only
+            delete trees, so a file would be stuck in the trash for good
+    """
+    if not os.path.isdir(path):
+        raise NotADirectoryError(
+            errno.ENOTDIR, os.strerror(errno.ENOTDIR), str(path)
+        )
+
+    trash_dir.mkdir(exist_ok=True)
+    if trash_dir not in _swept_trash_dirs:
+        _swept_trash_dirs.add(trash_dir)
+        with os.scandir(trash_dir) as it:
+            for entry in it:
+                remove_tree_later(entry.path)
+
+    trashed = trash_dir / f"{Path(path).name}-{uuid.uuid4().hex}"
+    os.rename(path, trashed)
+    remove_tree_later(trashed)
+
+
+def copy_tree(
+    src: PathType, dst: PathType, link_dest: Optional[PathType] = None
+) -> None:
+    """Recursively copy a directory tree using reflink clones where possible.
+
+    When ``link_dest`` is given (rsync ``--link-dest`` semantics), files whose
+    size and mtime match the file at the same relative path under
+    ``link_dest`` are hardlinked to it instead of copied, so unchanged files
+    share one inode across snapshots.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        link_dest: Optional earlier copy of ``src`` to deduplicate against
+    """
+    copy_function = clone_file
+    if link_dest is not None:
+        copy_function = partial(
+            _link_or_clone, src_root=Path(src), link_root=Path(link_dest)
+        )
+    _copy_tree_sorted(src, dst, copy_function)
+
+
+def link_tree(src: PathType, dst: PathType) -> None:
+    """Mirror a directory tree with hardlinks to every file.
+
+    The copy shares all file data with ``src``. That is safe for snapshots
+    because their files are never modified in place: restores copy out,
+    and metadata writes replace the file instead of rewriting it. Files
+    that can't be linked (other filesystem, link limit) are cloned instead.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+    """
+    _copy_tree_sorted(src, dst, _link_file)
+
+
+def _copy_tree_sorted(
+    src: PathType, dst: PathType, copy_function: Callable[[str, str], Any]
+) -> None:
+    """Copy src into a new dst directory, visiting files in inode order.
+
+    The tree is scanned completely before anything is copied, so all the
+    directory reads happen together and the file copies run as one batch
+    on a thread pool. Submitting in inode order instead of directory order
+    keeps reads moving forward through the inode table rather than seeking
+    per entry, which matters on cold caches and spinning disks.
+    """
+    dirs, files = _plan_tree(src, dst)
+
+    # Parents come before children, so each mkdir finds its parent in place
+    os.makedirs(dirs[0][1])
+    for _, target in dirs[1:]:
+        os.mkdir(target)
+
+    if len(files) > 1:
+        # The copies are independent and spend their time in syscalls with
+        # the GIL released, so overlapping them keeps the disk queue busy.
+        # Consuming map() re-raises the first failure.
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            list(pool.map(lambda pair: copy_function(*pair), files))
+    else:
+        for source, target in files:
+            copy_function(source, target)
+
+    # Copy directory times last, since filling a directory updates its mtime
+    for source, target in reversed(dirs):
+        shutil.copystat(source, target)
+
+
+def _plan_tree(
+    src: PathType, dst: PathType
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Walk src once and pair every directory and file with its destination.
+
+    Returns:
+        Tuple of (directories parents-first, files in inode order)
+    """
+    dirs = [(os.fspath(src), os.fspath(dst))]
+    files = []
+    # dirs grows while it is walked, giving a breadth-first traversal
+    for source_dir, target_dir in dirs:
+        with os.scandir(source_dir) as it:
+            for entry in it:
+                target = os.path.join(target_dir, entry.name)
+                if entry.is_dir():
+                    dirs.append((entry.path, target))
+                else:
+                    files.append((entry.inode(), entry.path, target))
+
+    files.sort()
+    return dirs, [(source, target) for _, source, target in files]
+
+
+def _link_file(src: PathType, dst: PathType) -> PathType:
+    """Hardlink dst to src, cloning it if linking isn't possible."""
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        return clone_file(src, dst)
+
+
+def _link_or_clone(
+    src: PathType, dst: PathType, src_root: Path, link_root: Path
+) -> PathType:
+    """Hardlink dst to the matching file under link_root, or clone src."""
+    ref = link_root / Path(src).relative_to(src_root)
+    try:
+        ref_st = ref.stat()
+        src_st = os.stat(src)
+    except OSError:
+        return clone_file(src, dst)
+
+    if (
+        stat.S_ISREG(ref_st.st_mode)
+        and ref_st.st_size == src_st.st_size
+        and ref_st.st_mtime_ns == src_st.st_mtime_ns
+    ):
+        try:
+            os.link(ref, dst)
+            return dst
+        except OSError:
+            # Cross-device or link limit reached: fall back to a real copy
+            pass
+
+    return clone_file(src, dst)
@@ -0,0 +1,90 @@
+"""JSON file IO for metadata and config files.
+
+Uses orjson when it is installed (``pip install .[fast]``) and falls back
+to the standard library otherwise. Both produce the same 2-space indented
+layout with non-ASCII text written as raw UTF-8, so files stay
+interchangeable.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def load_json(path: Path) -> Any:
+    """Parse a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(path: Path, obj: Any) -> bool:
+    """Serialize obj to a JSON file with 2-space indentation.
+
+    The file is left untouched when it already holds exactly these bytes.
+
+    Args:
+        path: File to write
+        obj: JSON-serializable value
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        # orjson never escapes non-ASCII, so neither may the fallback
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    _atomic_write_bytes(path, data)
+    return True
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path so readers see either the old or the new file.
+
+    The bytes go to a sibling temp file that is fsynced and then renamed
+    over path, so an interrupted write never leaves truncated JSON behind.
+    The temp name is unique, so a background save and the TUI writing the
+    same file can't clobber each other's half-written temp file.
+    """
+    fd, tmp = tempfile.mkstemp(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            # mkstemp creates the file readable by its owner only
+            os.fchmod(fh.fileno(), 0o644)
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -1,30 +1,40 @@
 """Logging system for Hades backup operations."""
 
+import atexit
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Tuple
+from itertools import islice
+from typing import Deque, List, Optional, TextIO, Tuple
 
-from .constants import LOG_FILE, MAX_LOG_ENTRIES
+from .constants import BACKUP_SAVE_ROOT, LOG_FILE, MAX_LOG_ENTRIES
+from .file_ops import ensure_dir
 
 
 class Logger:
     """Simple logging system for Hades backup operations."""
 
     def __init__(self) -> None:
-        self.logs: List[Tuple[datetime, str, str]] = []  # (timestamp, level, message)
         self.max_logs = MAX_LOG_ENTRIES
+        # (time.time() timestamp, level, message); timestamps are only
+        # formatted when shown. The deque drops the oldest entry itself
+        self.logs: Deque[Tuple[float, str, str]] = deque(maxlen=self.max_logs)
+        # Entries for the log file; None tells the writer thread to stop
+        self._file_queue: "queue.SimpleQueue[Optional[Tuple[float, str, str]]]" = (
+            queue.SimpleQueue()
+        )
+        self._writer: Optional[threading.Thread] = None  # started on first write
+        self._writer_lock = threading.Lock()
 
     def log(self, level: str, message: str) -> None:
         """Add a log entry."""
-        timestamp = datetime.now()
-        entry = (timestamp, level, message)
+        entry = (time.time(), level, message)
         self.logs.append(entry)
 
-        # Keep only the last max_logs entries
-        if len(self.logs) > self.max_logs:
-            self.logs = self.logs[-self.max_logs :]
-
         # Also write to file
-        self._write_to_file(timestamp, level, message)
+        self._write_to_file(entry)
 
     def info(self, message: str) -> None:
         """Log an info message."""
@@ -52,28 +62,87 @@ class Logger:
 
     def get_recent_logs(self, count: int = 10) -> List[str]:
         """Get recent log entries as formatted strings."""
-        recent = self.logs[-count:] if self.logs else []
+        recent = islice(self.logs, max(0, len(self.logs) - count), None)
         return [
-            f"[{ts.strftime('%H:%M:%S')}] {level}: {msg}" for ts, level, msg in recent
+            f"[{time.strftime('%H:%M:%S', time.localtime(ts))}] {level}: {msg}"
+            for ts, level, msg in recent
         ]
 
     def clear(self) -> None:
         """Clear all logs."""
         self.logs.clear()
 
-    def _write_to_file(self, timestamp: datetime, level: str, message: str) -> None:
-        """Write log entry to file."""
+    def _write_to_file(self, entry: Tuple[float, str, str]) -> None:
+        """Queue a log entry for the background file writer."""
         try:
-            from .constants import BACKUP_SAVE_ROOT
-
-            BACKUP_SAVE_ROOT.mkdir(parents=True, exist_ok=True)
-            log_line = f"{timestamp.isoformat()} {level}: {message}\n"
-            with LOG_FILE.open("a", encoding="utf-8") as f:
-                f.write(log_line)
+            self._file_queue.put(entry)
+            if self._writer is None:
+                self._start_writer()
         except Exception:
             # Don't let logging errors break the application
             pass
 
+    def _start_writer(self) -> None:
+        """Start the thread that writes queued entries to the log file."""
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="hades-log-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self._stop_writer)
+
+    def _stop_writer(self) -> None:
+        """Flush everything still queued and stop the writer thread."""
+        if self._writer is not None:
+            self._file_queue.put(None)
+            self._writer.join()
+
+    def _writer_loop(self) -> None:
+        """Append queued entries to the log file in batches until stopped."""
+        try:
+            fh: Optional[TextIO] = self._open_log_file()
+        except Exception:
+            fh = None  # keep draining the queue so memory doesn't grow
+
+        stopping = False
+        while not stopping:
+            # Block for one entry, then take whatever else is queued so a
+            # burst of entries costs a single write and flush
+            entries = [self._file_queue.get()]
+            try:
+                while True:
+                    entries.append(self._file_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            stopping = None in entries
+            if fh is not None:
+                # Formatting happens here, off the thread that logged
+                lines = [
+                    f"{datetime.fromtimestamp(ts).isoformat()} {level}: {msg}\n"
+                    for ts, level, msg in filter(None, entries)
+                ]
+                try:
+                    fh.write("".join(lines))
+                    fh.flush()
+                except Exception:
+                    pass
+
+        if fh is not None:
+            fh.close()
+
+    def _open_log_file(self) -> TextIO:
+        """Open the log file for appending."""
+        ensure_dir(BACKUP_SAVE_ROOT)
+        try:
+            return LOG_FILE.open("a", encoding="utf-8")
+        except FileNotFoundError:
+            # The backup root was removed after ensure_dir() first saw it
+            ensure_dir(BACKUP_SAVE_ROOT, recheck=True)
+            return LOG_FILE.open("a", encoding="utf-8")
+
 
 # Global logger instance
 logger = Logger()
@@ -1,9 +1,15 @@
 """Metadata handling for Hades save snapshots."""
 
-import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
+from .cache import MISS, StatCache, invalidate
+from .json_io import dump_json, load_json
+
+# Parsed meta.json contents per file, stamped with the file's mtime
+_meta_cache = StatCache()
+
 
 def write_meta(snapshot: Path, tags: Iterable[str], note: Optional[str]) -> None:
     """Write metadata for a snapshot.
@@ -17,12 +23,18 @@ def write_meta(snapshot: Path, tags: Iterable[str], note: Optional[str]) -> None
     """
     # In the new system, the note is part of the directory name
     # So we'll just store the provided note as-is
+    # dict.fromkeys dedupes cheaply; one or no tags needs no sorting
+    unique_tags = list(dict.fromkeys(tags))
+    if len(unique_tags) > 1:
+        unique_tags.sort()
+
     meta = {
         "created_at": snapshot.name,  # Store the full name including note
-        "tags": sorted(set(tags)),
+        "tags": unique_tags,
         "note": note,  # Store the original note
     }
-    (snapshot / "meta.json").write_text(json.dumps(meta, indent=2))
+    if dump_json(snapshot / "meta.json", meta):
+        invalidate()
 
 
 def read_meta(snapshot: Path) -> Dict[str, Any]:
@@ -35,7 +47,11 @@ def read_meta(snapshot: Path) -> Dict[str, Any]:
         Dictionary containing metadata, empty if no metadata exists
     """
     meta_file = snapshot / "meta.json"
-    if not meta_file.exists():
+    try:
+        stamp = os.stat(meta_file).st_mtime_ns
+    except FileNotFoundError:
+        stamp = None
+    if stamp is None:
         # Fallback: extract info from directory name
         snapshot_name = snapshot.name
         # Split on first underscore to separate timestamp from note
@@ -50,7 +66,17 @@ def read_meta(snapshot: Path) -> Dict[str, Any]:
         }
 
     # If metadata file exists, load it and update with info from directory name
-    meta = json.loads(meta_file.read_text())
+    # The TUI reads the selected snapshot's metadata on every redraw, so
+    # only parse the file again once it has changed
+    parsed = _meta_cache.get(meta_file, stamp)
+    if parsed is MISS:
+        parsed = load_json(meta_file)
+        _meta_cache.put(meta_file, stamp, parsed)
+
+    # Callers get their own copy to modify
+    meta = dict(parsed)
+    if isinstance(meta.get("tags"), list):
+        meta["tags"] = list(meta["tags"])
 
     # Update created_at to use the full directory name
     meta["created_at"] = snapshot.name
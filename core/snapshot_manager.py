@@ -1,13 +1,35 @@
 """Snapshot management for Hades save backups."""
 
+import os
+import re
 import shutil
-from datetime import datetime
+import time
+import uuid
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from .constants import BACKUP_SAVE_ROOT, HADES_SAVE_DIR
+from .cache import MISS, StatCache, invalidate
+from .constants import (
+    BACKUP_SAVE_ROOT,
+    HADES_SAVE_DIR,
+    RESERVED_NAMES,
+    TIMESTAMP_FORMAT,
+    TRASH_DIR_NAME,
+)
+from .file_ops import copy_tree, move_to_trash, remove_tree_later
 from .logger import logger
-from .tag_manager import add_tag
+from .tag_manager import add_tags, check_tag_name, snapshots_for_tag
+
+# Characters not allowed in a snapshot note. In str patterns \w is exactly
+# str.isalnum() plus '_', so Unicode letters in notes are still kept
+_NOTE_UNSAFE_RE = re.compile(r"[^\w .-]")
+
+# Last list_snapshots() result, stamped with the tag directory mtimes
+_snapshot_cache = StatCache()
+
+# Name prefixes of the trees restore() builds and replaces next to the saves
+_STAGE_PREFIX = ".hades_stage_"
+_OLD_PREFIX = ".hades_old_"
 
 
 def now_ts(note: Optional[str] = None) -> str:
@@ -19,10 +41,11 @@ def now_ts(note: Optional[str] = None) -> str:
     Returns:
         Timestamp string in YYYY-MM-DDTHH-MM-SS[_note] format
     """
-    timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+    # time.strftime formats the struct_time directly, no datetime object needed
+    timestamp = time.strftime(TIMESTAMP_FORMAT, time.localtime())
     if note:
         # Sanitize note to be filesystem-safe
-        sanitized_note = "".join(c for c in note if c.isalnum() or c in (' ', '-', '_', '.')).rstrip()
+        sanitized_note = _NOTE_UNSAFE_RE.sub("", note).rstrip()
         if sanitized_note:
             timestamp = f"{timestamp}_{sanitized_note}"
     return timestamp
@@ -48,18 +71,41 @@ def list_snapshots() -> List[Path]:
     if not BACKUP_SAVE_ROOT.exists():
         return []
     
-    # Look for snapshots in all tag directories (excluding reserved names)
-    reserved_names = {'config.json', 'hades.log'}
-    for item in BACKUP_SAVE_ROOT.iterdir():
-        if item.is_dir() and item.name not in reserved_names:
+    # Look for snapshots in all tag directories (excluding reserved names).
+    # os.scandir gets the entry type from readdir, saving a stat per entry.
+    with os.scandir(BACKUP_SAVE_ROOT) as it:
+        tag_dirs = [
+            entry for entry in it
+            if entry.is_dir() and entry.name not in RESERVED_NAMES
+        ]
+
+    # Adding or removing a snapshot bumps the mtime of its tag directory,
+    # so the tag directory mtimes tell us whether the last scan is still valid
+    stamp = tuple((entry.name, entry.stat().st_mtime_ns) for entry in tag_dirs)
+    cached = _snapshot_cache.get(BACKUP_SAVE_ROOT, stamp)
+    if cached is not MISS:
+        return list(cached)
+
+    if len(tag_dirs) == 1:
+        # A single tag can't hold duplicates, so skip the bookkeeping
+        with os.scandir(tag_dirs[0].path) as it:
+            all_snapshots = [Path(entry.path) for entry in it if entry.is_dir()]
+    else:
+        seen = set()
+        for tag_entry in tag_dirs:
             # Add all snapshots from this tag directory
-            for snapshot in item.iterdir():
-                if snapshot.is_dir():
-                    # Only add each snapshot once (by checking if it's already in the list)
-                    if not any(s.name == snapshot.name for s in all_snapshots):
-                        all_snapshots.append(snapshot)
-    
-    return sorted(all_snapshots, reverse=True)
+            with os.scandir(tag_entry.path) as it:
+                for entry in it:
+                    # Only add each snapshot once, even if several tags hold it
+                    if entry.is_dir() and entry.name not in seen:
+                        seen.add(entry.name)
+                        all_snapshots.append(Path(entry.path))
+
+    # Snapshot names start with an ISO timestamp, so sorting the name strings
+    # is chronological and much cheaper than comparing whole Path objects
+    all_snapshots.sort(key=lambda p: p.name, reverse=True)
+    _snapshot_cache.put(BACKUP_SAVE_ROOT, stamp, all_snapshots)
+    return list(all_snapshots)
 
 
 def save(tags: List[str], note: Optional[str]) -> Tuple[Optional[Path], str]:
@@ -81,18 +127,28 @@ def save(tags: List[str], note: Optional[str]) -> Tuple[Optional[Path], str]:
         if not tags:
             # If no tags specified, create a default "untagged" tag
             tags = ["untagged"]
+
+        # A reserved name would put the snapshot where no listing sees it
+        for tag in tags:
+            error_msg = check_tag_name(tag)
+            if error_msg:
+                raise ValueError(error_msg)
         
         # Create snapshot in the first tag directory
         first_tag = tags[0]
         tag_dir = BACKUP_SAVE_ROOT / first_tag
-        tag_dir.mkdir(exist_ok=True)
+        # parents=True creates the backup root too when it is missing
+        tag_dir.mkdir(parents=True, exist_ok=True)
         
+        # Hardlink files that haven't changed since the newest snapshot
+        existing = list_snapshots()
+        previous = existing[0] if existing else None
+
         dest = tag_dir / snapshot_name
-        shutil.copytree(HADES_SAVE_DIR, dest)
+        copy_tree(HADES_SAVE_DIR, dest, link_dest=previous)
 
         # Add to additional tags by copying to those directories
-        for tag in tags[1:]:
-            add_tag(tag, dest)
+        add_tags(tags[1:], dest)
 
         tag_str = f" with tags {tags}" if tags else ""
         note_str = f" (note: {note})" if note else ""
@@ -103,6 +159,8 @@ def save(tags: List[str], note: Optional[str]) -> Tuple[Optional[Path], str]:
         error_msg = f"Failed to create snapshot: {str(e)}"
         logger.error(error_msg)
         return None, error_msg
+    finally:
+        invalidate()
 
 
 def restore(snapshot: Path) -> Tuple[bool, str]:
@@ -117,13 +175,44 @@ def restore(snapshot: Path) -> Tuple[bool, str]:
     try:
         assert_game_folder_exist()
 
-        tmp = HADES_SAVE_DIR.with_suffix(".tmp")
-        if tmp.exists():
-            shutil.rmtree(tmp)
-
-        shutil.move(HADES_SAVE_DIR, tmp)
-        shutil.copytree(snapshot, HADES_SAVE_DIR)
-        shutil.rmtree(tmp)
+        # Left behind by older versions, which restored through a .tmp move
+        # Missing is the common case, so skip the exists() stat
+        try:
+            shutil.rmtree(HADES_SAVE_DIR.with_suffix(".tmp"))
+        except FileNotFoundError:
+            pass
+
+        _sweep_restore_leftovers()
+
+        # Build the restored tree next to the live one first, so a failed
+        # copy leaves the current saves untouched
+        staging = HADES_SAVE_DIR.parent / f"{_STAGE_PREFIX}{os.getpid()}"
+        try:
+            shutil.rmtree(staging)
+        except FileNotFoundError:
+            pass
+        try:
+            # Live files that already match the snapshot (same size and
+            # mtime) are linked into the staging tree instead of copied.
+            # Links only ever point at the live saves, never into the
+            # backup, so the game writing to its files can't alter snapshots
+            copy_tree(snapshot, staging, link_dest=HADES_SAVE_DIR)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # Swap the directories with two renames in the same parent
+        old = HADES_SAVE_DIR.parent / f"{_OLD_PREFIX}{uuid.uuid4().hex}"
+        os.replace(HADES_SAVE_DIR, old)
+        try:
+            os.replace(staging, HADES_SAVE_DIR)
+        except BaseException:
+            os.replace(old, HADES_SAVE_DIR)
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        # The replaced saves are out of the way, so don't wait for the delete
+        remove_tree_later(old)
 
         success_msg = f"Restored snapshot {snapshot.name}"
         logger.success(success_msg)
@@ -134,6 +223,44 @@ def restore(snapshot: Path) -> Tuple[bool, str]:
         return False, error_msg
 
 
+def _sweep_restore_leftovers() -> None:
+    """Delete staging and replaced save trees left by crashed restores.
+
+    A staging tree is only swept once the process that built it is gone,
+    so a restore running in another process keeps its own.
+    """
+    try:
+        it = os.scandir(HADES_SAVE_DIR.parent)
+    except FileNotFoundError:
+        return
+    with it:
+        for entry in it:
+            if entry.name.startswith(_OLD_PREFIX):
+                remove_tree_later(entry.path)
+            elif entry.name.startswith(_STAGE_PREFIX):
+                pid = entry.name[len(_STAGE_PREFIX):]
+                if (
+                    pid.isdigit()
+                    and int(pid) != os.getpid()
+                    and not _pid_alive(int(pid))
+                ):
+                    remove_tree_later(entry.path)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with this pid is still running."""
+    if os.name != "posix":
+        # os.kill() terminates the process on Windows, so assume it's alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # it exists, but belongs to another user
+    return True
+
+
 def restore_by_tag(tag: str) -> Tuple[bool, str]:
     """Restore latest snapshot with given tag.
 
@@ -144,19 +271,14 @@ def restore_by_tag(tag: str) -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        # Import here to avoid circular imports
-        from .tag_manager import snapshots_for_tag
-
         matches = snapshots_for_tag(tag)
         if not matches:
             error_msg = f"No snapshots for tag '{tag}'"
             logger.error(error_msg)
             return False, error_msg
 
-        # Find the latest snapshot in the tag directory
-        tag_dir = BACKUP_SAVE_ROOT / tag
-        snapshot_paths = [tag_dir / name for name in matches]
-        latest_snapshot = sorted(snapshot_paths, reverse=True)[0]
+        # Names start with an ISO timestamp, so the largest name is the latest
+        latest_snapshot = BACKUP_SAVE_ROOT / tag / max(matches)
         return restore(latest_snapshot)
     except Exception as e:
         error_msg = f"Failed to restore by tag: {str(e)}"
@@ -176,13 +298,18 @@ def delete_snapshot(snapshot: Path) -> Tuple[bool, str]:
     try:
         snapshot_name = snapshot.name
         
-        # Remove from all tag directories where it exists
-        reserved_names = {'config.json', 'hades.log'}
-        for tag_dir in BACKUP_SAVE_ROOT.iterdir():
-            if tag_dir.is_dir() and tag_dir.name not in reserved_names:
-                snapshot_in_tag = tag_dir / snapshot_name
-                if snapshot_in_tag.exists() and snapshot_in_tag.is_dir():
-                    shutil.rmtree(snapshot_in_tag)
+        # Remove from all tag directories where it exists. Each copy is
+        # renamed into the trash right away, so it disappears from every
+        # listing, and the files are deleted in the background
+        trash_dir = BACKUP_SAVE_ROOT / TRASH_DIR_NAME
+        with os.scandir(BACKUP_SAVE_ROOT) as it:
+            for entry in it:
+                if not entry.is_dir() or entry.name in RESERVED_NAMES:
+                    continue
+                # isdir() is False for missing paths, so one stat covers both checks
+                snapshot_in_tag = os.path.join(entry.path, snapshot_name)
+                if os.path.isdir(snapshot_in_tag):
+                    move_to_trash(snapshot_in_tag, trash_dir)
 
         success_msg = f"Deleted snapshot {snapshot.name}"
         logger.success(success_msg)
@@ -192,3 +319,5 @@ def delete_snapshot(snapshot: Path) -> Tuple[bool, str]:
         error_msg = f"Failed to delete snapshot: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
+    finally:
+        invalidate()
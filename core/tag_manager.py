@@ -1,12 +1,40 @@
 """Tag management for Hades save snapshots."""
 
-import shutil
+import os
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from .constants import BACKUP_SAVE_ROOT
+from .cache import MISS, StatCache, dir_mtime, invalidate
+from .constants import BACKUP_SAVE_ROOT, RESERVED_NAMES, TRASH_DIR_NAME
+from .file_ops import link_tree, move_to_trash
 from .logger import logger
 
+# Last list_tags() result, stamped with the backup root mtime
+_tags_cache = StatCache()
+
+# Snapshot names per tag directory, stamped with that directory's mtime
+_tag_snapshots_cache = StatCache()
+
+# Snapshot name -> tags holding it, stamped with every tag directory's mtime
+_snapshot_tags_cache = StatCache()
+
+
+def check_tag_name(tag: str) -> Optional[str]:
+    """Check that a name can be used for a tag directory.
+
+    Tags share the backup root with the config file, the log and the trash,
+    so those names are never accepted as tags.
+
+    Args:
+        tag: Name of the tag
+
+    Returns:
+        Error message if the name is reserved, None otherwise
+    """
+    if tag in RESERVED_NAMES:
+        return f"'{tag}' is a reserved name and cannot be used as a tag"
+    return None
+
 
 def add_tag(tag: str, snapshot_path: Path) -> None:
     """Copy a snapshot to a tag directory.
@@ -15,15 +43,89 @@ def add_tag(tag: str, snapshot_path: Path) -> None:
         tag: Name of the tag
         snapshot_path: Path to the snapshot to add
     """
+    add_tags([tag], snapshot_path)
+
+
+def add_tags(tags: Iterable[str], snapshot_path: Path) -> None:
+    """Copy a snapshot to several tag directories at once.
+
+    Tags that already hold the snapshot are left untouched.
+
+    Args:
+        tags: Names of the tags
+        snapshot_path: Path to the snapshot to add
+
+    Raises:
+        ValueError: If any of the tags is a reserved name
+    """
+    tags = list(tags)
+    # Check every name first, so a reserved one doesn't leave the snapshot
+    # in only some of the tags
+    for tag in tags:
+        error_msg = check_tag_name(tag)
+        if error_msg:
+            raise ValueError(error_msg)
+
+    changed = False
+    for tag in tags:
+        changed |= _copy_to_tag(tag, snapshot_path)
+    if changed:
+        invalidate()
+
+
+def _copy_to_tag(tag: str, snapshot_path: Path) -> bool:
+    """Add a hardlinked copy of a snapshot to one tag directory.
+
+    Returns:
+        True if the snapshot was copied, False if the tag already had it
+    """
     tag_dir = BACKUP_SAVE_ROOT / tag
     tag_dir.mkdir(exist_ok=True)
 
-    # Copy the snapshot to the tag directory
-    # This allows the same snapshot to exist in multiple tags
+    # Mirror the snapshot into the tag directory
+    # This allows the same snapshot to exist in multiple tags, while the
+    # hardlinks keep a single copy of the save data on disk
     new_snapshot_path = tag_dir / snapshot_path.name
-    if not new_snapshot_path.exists():
-        import shutil
-        shutil.copytree(snapshot_path, new_snapshot_path)
+    if new_snapshot_path.exists():
+        return False
+
+    link_tree(snapshot_path, new_snapshot_path)
+    return True
+
+
+def create_tag(tag: str) -> Tuple[bool, str]:
+    """Create an empty tag directory.
+
+    Args:
+        tag: Name of the tag to create
+
+    Returns:
+        Tuple of (success, message)
+    """
+    error_msg = check_tag_name(tag)
+    if error_msg:
+        logger.error(error_msg)
+        return False, error_msg
+
+    tag_dir = BACKUP_SAVE_ROOT / tag
+    if tag_dir.exists():
+        error_msg = f"Tag '{tag}' already exists"
+        logger.error(error_msg)
+        return False, error_msg
+
+    try:
+        # Just create the directory - it will be used when snapshots are added
+        tag_dir.mkdir(parents=True, exist_ok=True)
+
+        success_msg = f"Created tag '{tag}'"
+        logger.success(success_msg)
+        return True, success_msg
+    except Exception as e:
+        error_msg = f"Failed to create tag: {str(e)}"
+        logger.error(error_msg)
+        return False, error_msg
+    finally:
+        invalidate()
 
 
 def snapshots_for_tag(tag: str) -> List[str]:
@@ -36,11 +138,19 @@ def snapshots_for_tag(tag: str) -> List[str]:
         List of snapshot names, empty if tag doesn't exist
     """
     tag_dir = BACKUP_SAVE_ROOT / tag
-    if not tag_dir.exists():
+    stamp = dir_mtime(tag_dir)
+    if not stamp:
         return []
-    
+
+    cached = _tag_snapshots_cache.get(tag_dir, stamp)
+    if cached is not MISS:
+        return list(cached)
+
     # Return the names of all directories in the tag directory (which represent snapshots)
-    return [item.name for item in tag_dir.iterdir() if item.is_dir()]
+    with os.scandir(tag_dir) as it:
+        names = [entry.name for entry in it if entry.is_dir()]
+    _tag_snapshots_cache.put(tag_dir, stamp, names)
+    return list(names)
 
 
 def list_tags() -> List[str]:
@@ -50,13 +160,54 @@ def list_tags() -> List[str]:
         Sorted list of tag names
     """
     # Tags are directories in the backup root that are not reserved names
-    reserved_names = {'saves', 'config.json', 'hades.log', 'tags'}
     if not BACKUP_SAVE_ROOT.exists():
         return []
-    return sorted(
-        p.name for p in BACKUP_SAVE_ROOT.iterdir() 
-        if p.is_dir() and p.name not in reserved_names
-    )
+
+    # Creating, renaming or deleting a tag directory bumps the root's mtime
+    stamp = dir_mtime(BACKUP_SAVE_ROOT)
+    cached = _tags_cache.get(BACKUP_SAVE_ROOT, stamp)
+    if cached is not MISS:
+        return list(cached)
+
+    with os.scandir(BACKUP_SAVE_ROOT) as it:
+        tags = sorted(
+            entry.name for entry in it
+            if entry.is_dir() and entry.name not in RESERVED_NAMES
+        )
+    _tags_cache.put(BACKUP_SAVE_ROOT, stamp, tags)
+    return list(tags)
+
+
+def tags_for_snapshot(snapshot_name: str) -> List[str]:
+    """Get every tag that holds a snapshot.
+
+    The tag directories are the authoritative record of membership, so this
+    is preferred over the tags stored in a snapshot's meta.json.
+
+    Args:
+        snapshot_name: Name of the snapshot directory
+
+    Returns:
+        Sorted list of tag names, empty if no tag holds the snapshot
+    """
+    return list(_snapshot_tags_index().get(snapshot_name, ()))
+
+
+def _snapshot_tags_index() -> Dict[str, List[str]]:
+    """Map each snapshot name to the sorted tags that hold it."""
+    tags = list_tags()
+    stamp = tuple((tag, dir_mtime(BACKUP_SAVE_ROOT / tag)) for tag in tags)
+    cached = _snapshot_tags_cache.get(BACKUP_SAVE_ROOT, stamp)
+    if cached is not MISS:
+        return cached
+
+    # list_tags() is sorted, so each list comes out sorted too
+    index: Dict[str, List[str]] = {}
+    for tag in tags:
+        for name in snapshots_for_tag(tag):
+            index.setdefault(name, []).append(tag)
+    _snapshot_tags_cache.put(BACKUP_SAVE_ROOT, stamp, index)
+    return index
 
 
 def get_tag_count(tag: str) -> int:
@@ -86,6 +237,11 @@ def rename_tag(old_tag: str, new_tag: str) -> Tuple[bool, str]:
     if old_tag == new_tag:
         return False, "New tag name is the same as old name"
 
+    error_msg = check_tag_name(old_tag) or check_tag_name(new_tag)
+    if error_msg:
+        logger.error(error_msg)
+        return False, error_msg
+
     old_dir = BACKUP_SAVE_ROOT / old_tag
     new_dir = BACKUP_SAVE_ROOT / new_tag
 
@@ -110,6 +266,8 @@ def rename_tag(old_tag: str, new_tag: str) -> Tuple[bool, str]:
         error_msg = f"Failed to rename tag: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
+    finally:
+        invalidate()
 
 
 def delete_tag(tag: str) -> Tuple[bool, str]:
@@ -121,16 +279,23 @@ def delete_tag(tag: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
+    error_msg = check_tag_name(tag)
+    if error_msg:
+        logger.error(error_msg)
+        return False, error_msg
+
     tag_dir = BACKUP_SAVE_ROOT / tag
 
-    if not tag_dir.exists():
+    # Only directories are tags; any other file in the backup root is left
+    # alone rather than moved into the trash
+    if not tag_dir.is_dir():
         error_msg = f"Tag '{tag}' does not exist"
         logger.error(error_msg)
         return False, error_msg
 
     try:
         # Delete tag directory and all its contents
-        shutil.rmtree(tag_dir)
+        move_to_trash(tag_dir, BACKUP_SAVE_ROOT / TRASH_DIR_NAME)
 
         success_msg = f"Deleted tag '{tag}' and all its snapshots"
         logger.success(success_msg)
@@ -139,6 +304,8 @@ def delete_tag(tag: str) -> Tuple[bool, str]:
         error_msg = f"Failed to delete tag: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
+    finally:
+        invalidate()
 
 
 def get_snapshot_tag(snapshot_path: Path) -> Optional[str]:
@@ -152,16 +319,15 @@ def get_snapshot_tag(snapshot_path: Path) -> Optional[str]:
     """
     if not BACKUP_SAVE_ROOT.exists():
         return None
-    
-    reserved_names = {'saves', 'config.json', 'hades.log', 'tags'}
-    
-    for tag_dir in BACKUP_SAVE_ROOT.iterdir():
-        if tag_dir.is_dir() and tag_dir.name not in reserved_names:
-            # Check if this snapshot exists in this tag directory
-            snapshot_in_tag = tag_dir / snapshot_path.name
-            if snapshot_in_tag.exists() and snapshot_in_tag.is_dir():
-                return tag_dir.name
-    
+
+    with os.scandir(BACKUP_SAVE_ROOT) as it:
+        for entry in it:
+            if entry.is_dir() and entry.name not in RESERVED_NAMES:
+                # Check if this snapshot exists in this tag directory
+                snapshot_in_tag = os.path.join(entry.path, snapshot_path.name)
+                if os.path.isdir(snapshot_in_tag):
+                    return entry.name
+
     return None
 
 
@@ -178,6 +344,11 @@ def merge_tags(source_tag: str, target_tag: str) -> Tuple[bool, str]:
     if source_tag == target_tag:
         return False, "Cannot merge tag into itself"
 
+    error_msg = check_tag_name(source_tag) or check_tag_name(target_tag)
+    if error_msg:
+        logger.error(error_msg)
+        return False, error_msg
+
     source_dir = BACKUP_SAVE_ROOT / source_tag
     target_dir = BACKUP_SAVE_ROOT / target_tag
 
@@ -190,16 +361,17 @@ def merge_tags(source_tag: str, target_tag: str) -> Tuple[bool, str]:
         # Create target directory if it doesn't exist
         target_dir.mkdir(exist_ok=True)
 
-        # Move all snapshots from source to target
-        for snapshot in source_dir.iterdir():
-            if snapshot.is_dir():
-                target_snapshot_path = target_dir / snapshot.name
-                if not target_snapshot_path.exists():
-                    # Copy the snapshot to target directory
-                    shutil.copytree(snapshot, target_snapshot_path)
+        # Move all snapshots from source to target. Both tags live in the
+        # backup root, so a rename moves each snapshot without copying data
+        with os.scandir(source_dir) as it:
+            snapshots = [entry for entry in it if entry.is_dir()]
+        for snapshot in snapshots:
+            target_snapshot_path = target_dir / snapshot.name
+            if not target_snapshot_path.exists():
+                os.rename(snapshot.path, target_snapshot_path)
 
-        # Delete source tag directory
-        shutil.rmtree(source_dir)
+        # Delete source tag directory (and snapshots the target already had)
+        move_to_trash(source_dir, BACKUP_SAVE_ROOT / TRASH_DIR_NAME)
 
         success_msg = f"Merged tag '{source_tag}' into '{target_tag}'"
         logger.success(success_msg)
@@ -208,3 +380,5 @@ def merge_tags(source_tag: str, target_tag: str) -> Tuple[bool, str]:
         error_msg = f"Failed to merge tags: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
+    finally:
+        invalidate()
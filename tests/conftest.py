@@ -1,13 +1,32 @@
 """Test utilities and helpers for isolated test environments."""
 
+import importlib
 import json
+import os
+import re
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Union
 from unittest.mock import patch
 
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_log_file(tmp_path_factory):
+    """Send the global logger's file output to a temporary directory.
+
+    The writer thread opens the log file on the first logged message, so
+    this has to be in place for the whole session, before any test runs.
+    """
+    # core.logger as an attribute is the logger instance, not the module
+    logger_module = importlib.import_module("core.logger")
+    root = tmp_path_factory.mktemp("log")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(logger_module, "BACKUP_SAVE_ROOT", root)
+        mp.setattr(logger_module, "LOG_FILE", root / "hades.log")
+        yield root
+
+
 @pytest.fixture
 def temp_env(tmp_path: Path):
     """Create temporary environment for testing."""
@@ -22,6 +41,26 @@ def temp_env(tmp_path: Path):
     return root, tags, game_dir
 
 
+@pytest.fixture(scope="session")
+def _session_backup(tmp_path_factory):
+    """One temporary base directory shared by every backup root fixture."""
+    return tmp_path_factory.mktemp("backups")
+
+
+@pytest.fixture
+def temp_backup_root(_session_backup: Path, request, monkeypatch):
+    """Create an empty backup root for one test and patch tag_manager to it."""
+    # The node id includes the module, so equally named tests in two test
+    # files still get separate roots
+    root = _session_backup / re.sub(r"\W", "_", request.node.nodeid)
+    root.mkdir()
+
+    # Monkeypatch constants in tag_manager
+    monkeypatch.setattr("core.tag_manager.BACKUP_SAVE_ROOT", root)
+
+    return root
+
+
 @pytest.fixture
 def patched_constants(temp_env):
     """Patch all constants with temporary environment."""
@@ -49,3 +88,37 @@ def read_tag_file(tags_dir: Path, tag_name: str) -> List[str]:
     if tag_file.exists():
         return json.loads(tag_file.read_text())
     return []
+
+
+def make_snaps(
+    base: Union[str, Path], names: Iterable[str], content: bytes = b"mock content"
+) -> None:
+    """Create snapshot directories under base, each holding one mock file."""
+    os.makedirs(base, exist_ok=True)
+    for name in names:
+        snapshot_dir = os.path.join(base, name)
+        os.mkdir(snapshot_dir)
+        fd = os.open(
+            os.path.join(snapshot_dir, "mock_file.txt"),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+
+
+def snap_names(directory: Union[str, Path]) -> List[str]:
+    """Get the names of the snapshot directories in directory."""
+    with os.scandir(directory) as it:
+        return [entry.name for entry in it if entry.is_dir()]
+
+
+def read_small(path: Union[str, Path], size: int = 4096) -> bytes:
+    """Read up to size bytes of a small file without the text IO layers."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
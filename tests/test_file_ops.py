@@ -0,0 +1,128 @@
+"""Tests for filesystem copy helpers."""
+
+import pytest
+
+from core import file_ops
+
+
+def test_clone_file_copies_content_and_mtime(tmp_path):
+    """Test that a cloned file has the same bytes and timestamps."""
+    src = tmp_path / "Profile1.sav"
+    src.write_bytes(b"dummy save")
+    dst = tmp_path / "copy.sav"
+
+    file_ops.clone_file(src, dst)
+
+    assert dst.read_bytes() == b"dummy save"
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+def test_copy_tree_copies_nested_files(tmp_path):
+    """Test that copy_tree reproduces the whole directory tree."""
+    src = tmp_path / "Hades"
+    (src / "sub").mkdir(parents=True)
+    (src / "Profile1.sav").write_text("one")
+    (src / "sub" / "Profile2.sav").write_text("two")
+    dst = tmp_path / "snapshot"
+
+    file_ops.copy_tree(src, dst)
+
+    assert (dst / "Profile1.sav").read_text() == "one"
+    assert (dst / "sub" / "Profile2.sav").read_text() == "two"
+
+
+def test_copy_tree_hardlinks_unchanged_files(tmp_path):
+    """Test that link_dest dedupes unchanged files and copies changed ones."""
+    src = tmp_path / "Hades"
+    src.mkdir()
+    (src / "Profile1.sav").write_text("unchanged")
+    (src / "Profile2.sav").write_text("old")
+    first = tmp_path / "first"
+    file_ops.copy_tree(src, first)
+
+    (src / "Profile2.sav").write_text("new and longer")
+    second = tmp_path / "second"
+    file_ops.copy_tree(src, second, link_dest=first)
+
+    assert (second / "Profile1.sav").stat().st_ino == (first / "Profile1.sav").stat().st_ino
+    assert (second / "Profile2.sav").stat().st_ino != (first / "Profile2.sav").stat().st_ino
+    assert (second / "Profile2.sav").read_text() == "new and longer"
+    assert (first / "Profile2.sav").read_text() == "old"
+
+
+def test_clone_file_copies_multiple_chunks(tmp_path):
+    """Test that files larger than one copy chunk are copied completely."""
+    data = bytes(range(256)) * (file_ops.COPY_CHUNK_SIZE // 256 * 2 + 3)
+    src = tmp_path / "Profile1.sav"
+    src.write_bytes(data)
+    dst = tmp_path / "copy.sav"
+
+    file_ops.clone_file(src, dst)
+
+    assert dst.read_bytes() == data
+
+
+def test_link_tree_shares_inodes(tmp_path):
+    """Test that link_tree mirrors the tree with hardlinks."""
+    src = tmp_path / "snapshot"
+    (src / "sub").mkdir(parents=True)
+    (src / "Profile1.sav").write_text("one")
+    (src / "sub" / "Profile2.sav").write_text("two")
+    dst = tmp_path / "tagged"
+
+    file_ops.link_tree(src, dst)
+
+    assert (dst / "Profile1.sav").stat().st_ino == (src / "Profile1.sav").stat().st_ino
+    assert (dst / "sub" / "Profile2.sav").read_text() == "two"
+
+
+def test_move_to_trash_reaps_leftovers(tmp_path):
+    """Test that trashed trees and earlier leftovers are deleted."""
+    trash = tmp_path / ".trash"
+    leftover = trash / "old-snapshot"
+    leftover.mkdir(parents=True)
+    victim = tmp_path / "snapshot"
+    victim.mkdir()
+    (victim / "Profile1.sav").write_text("one")
+
+    file_ops.move_to_trash(victim, trash)
+    assert not victim.exists()
+
+    # The reaper has one worker, so this runs after the queued deletions
+    file_ops._reaper.submit(lambda: None).result()
+    assert list(trash.iterdir()) == []
+
+
+def test_clone_file_falls_back_when_copy_range_copies_nothing(tmp_path, monkeypatch):
+    """Test that a copy_file_range that silently copies nothing isn't trusted."""
+    src = tmp_path / "Profile1.sav"
+    src.write_bytes(b"dummy save")
+    dst = tmp_path / "copy.sav"
+    monkeypatch.setattr(file_ops, "_reflink", lambda src, dst: False)
+    monkeypatch.setattr(file_ops.os, "copy_file_range", lambda *args: 0, raising=False)
+
+    file_ops.clone_file(src, dst)
+
+    assert dst.read_bytes() == b"dummy save"
+
+
+def test_sendfile_reports_short_copy(tmp_path, monkeypatch):
+    """Test that a sendfile copy that stops early isn't reported as complete."""
+    src = tmp_path / "Profile1.sav"
+    src.write_bytes(b"dummy save")
+    monkeypatch.setattr(file_ops.os, "sendfile", lambda *args: 0, raising=False)
+
+    assert file_ops._sendfile(src, tmp_path / "copy.sav") is False
+
+
+def test_move_to_trash_refuses_files(tmp_path):
+    """Test that a plain file is never moved into the trash."""
+    trash = tmp_path / ".trash"
+    config = tmp_path / "config.json"
+    config.write_text("{}")
+
+    with pytest.raises(NotADirectoryError):
+        file_ops.move_to_trash(config, trash)
+
+    assert config.read_text() == "{}"
+    assert not trash.exists()
@@ -0,0 +1,70 @@
+"""Tests for the background log file writer."""
+
+import importlib
+import re
+import shutil
+
+from core import file_ops
+from core.constants import MAX_LOG_ENTRIES
+
+# core.logger as an attribute is the logger instance, not the module
+logger_module = importlib.import_module("core.logger")
+
+
+def _patch_log_file(monkeypatch, root):
+    """Point the logger module at a log file under root."""
+    monkeypatch.setattr(logger_module, "BACKUP_SAVE_ROOT", root)
+    monkeypatch.setattr(logger_module, "LOG_FILE", root / "hades.log")
+    return root / "hades.log"
+
+
+def test_logger_writes_every_entry(tmp_path, monkeypatch):
+    """Test that every queued entry reaches the file once the writer stops."""
+    log_file = _patch_log_file(monkeypatch, tmp_path)
+    log = logger_module.Logger()
+
+    count = MAX_LOG_ENTRIES * 2
+    for i in range(count):
+        log.info(f"message {i}")
+    log.error("last one")
+    log._stop_writer()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == count + 1
+    assert lines[0].endswith(" INFO: message 0")
+    assert lines[-1].endswith(" ERROR: last one")
+    # Batching keeps the order the entries were logged in
+    assert [line.split(": ", 1)[1] for line in lines[:count]] == [
+        f"message {i}" for i in range(count)
+    ]
+
+
+def test_get_recent_logs_formats_entries(tmp_path, monkeypatch):
+    """Test that recent logs are formatted and capped at MAX_LOG_ENTRIES."""
+    _patch_log_file(monkeypatch, tmp_path)
+    log = logger_module.Logger()
+
+    for i in range(MAX_LOG_ENTRIES + 5):
+        log.info(f"message {i}")
+    log.success("Created snapshot")
+    log._stop_writer()
+
+    recent = log.get_recent_logs(2)
+    assert len(recent) == 2
+    assert re.fullmatch(r"\[\d\d:\d\d:\d\d\] SUCCESS: Created snapshot", recent[-1])
+    assert recent[0].endswith(f"INFO: message {MAX_LOG_ENTRIES + 4}")
+    assert len(log.get_recent_logs(1000)) == MAX_LOG_ENTRIES
+
+
+def test_logger_recreates_removed_root(tmp_path, monkeypatch):
+    """Test that the writer opens the log after the backup root was removed."""
+    root = tmp_path / "backups"
+    log_file = _patch_log_file(monkeypatch, root)
+    file_ops.ensure_dir(root)
+    shutil.rmtree(root)
+    log = logger_module.Logger()
+
+    log.warning("root was removed")
+    log._stop_writer()
+
+    assert log_file.read_text(encoding="utf-8").endswith(" WARNING: root was removed\n")
@@ -1,5 +1,7 @@
 """Simple integration tests that don't need file system mocking."""
 
+import os
+
 from core.metadata_handler import read_meta, write_meta
 
 
@@ -21,8 +23,78 @@ def test_metadata_roundtrip(tmp_path):
     assert meta["created_at"] == snapshot_dir.name
 
 
+def test_write_meta_skips_unchanged(tmp_path):
+    """Test that rewriting identical metadata leaves the file untouched."""
+    snapshot_dir = tmp_path / "test_snapshot"
+    snapshot_dir.mkdir()
+    write_meta(snapshot_dir, ["boss", "test"], "note")
+    meta_file = snapshot_dir / "meta.json"
+    # Backdate the file so any rewrite would be visible in its mtime
+    os.utime(meta_file, ns=(0, 0))
+
+    write_meta(snapshot_dir, ["test", "boss", "test"], "note")
+
+    assert meta_file.stat().st_mtime_ns == 0
+
+
+def test_write_meta_leaves_no_temp_file(tmp_path):
+    """Test that the atomic metadata write cleans up after itself."""
+    snapshot_dir = tmp_path / "test_snapshot"
+    snapshot_dir.mkdir()
+
+    write_meta(snapshot_dir, ["boss"], "first")
+    write_meta(snapshot_dir, ["boss"], "second")
+
+    assert [p.name for p in snapshot_dir.iterdir()] == ["meta.json"]
+    assert read_meta(snapshot_dir)["note"] == "second"
+
+
+def test_read_meta_sees_rewrites(tmp_path):
+    """Test that cached metadata is private to callers and refreshed on write."""
+    snapshot_dir = tmp_path / "test_snapshot"
+    snapshot_dir.mkdir()
+    write_meta(snapshot_dir, ["boss"], "first")
+
+    read_meta(snapshot_dir)["tags"].append("mutated")
+    assert read_meta(snapshot_dir)["tags"] == ["boss"]
+
+    write_meta(snapshot_dir, ["boss", "test"], "second")
+    meta = read_meta(snapshot_dir)
+    assert meta["tags"] == ["boss", "test"]
+    assert meta["note"] == "second"
+
+
 def test_constants_import():
     """Test that constants can be imported."""
     from core.constants import BACKUP_SAVE_ROOT
 
     assert BACKUP_SAVE_ROOT is not None
+
+
+def test_set_last_tag_recreates_removed_root(tmp_path, monkeypatch):
+    """Test that set_last_tag still works after the backup root is removed."""
+    import shutil
+
+    from core import config
+
+    root = tmp_path / "backups"
+    monkeypatch.setattr(config, "BACKUP_SAVE_ROOT", root)
+    monkeypatch.setattr(config, "CONFIG_FILE", root / "config.json")
+
+    config.set_last_tag("boss")
+    shutil.rmtree(root)
+    config.set_last_tag("run")
+
+    assert config.get_last_tag() == "run"
+
+
+def test_dump_json_writes_utf8_without_orjson(tmp_path, monkeypatch):
+    """Test that the stdlib fallback writes non-ASCII text like orjson does."""
+    from core import json_io
+
+    monkeypatch.setattr(json_io, "orjson", None)
+    path = tmp_path / "meta.json"
+
+    json_io.dump_json(path, {"note": "Zagréus"})
+
+    assert path.read_bytes() == '{\n  "note": "Zagréus"\n}'.encode("utf-8")
@@ -1,5 +1,9 @@
 """Simple working tests for snapshot manager."""
 
+import os
+
+from .conftest import read_small
+
 
 def test_save_simple(patched_constants):
     """Test snapshot creation with simple approach."""
@@ -14,10 +18,8 @@ def test_save_simple(patched_constants):
     assert snap_path.exists(), "Snapshot directory should exist"
 
     # Check the save file was copied correctly
-    saved_content = (snap_path / "Profile1.sav").read_text(
-        encoding="utf-8", errors="replace"
-    )
-    assert saved_content == "dummy save", f"Content mismatch: {saved_content}"
+    saved_content = read_small(snap_path / "Profile1.sav")
+    assert saved_content == b"dummy save", f"Content mismatch: {saved_content}"
 
 
 def test_list_snapshots_simple(patched_constants):
@@ -52,14 +54,48 @@ def test_restore_simple(patched_constants):
     assert success, f"Restore should succeed but got: {msg}"
 
     # Verify content was restored
-    restored_content = (game_dir / "Profile1.sav").read_text(
-        encoding="utf-8", errors="replace"
-    )
-    assert restored_content == "dummy save", (
+    restored_content = read_small(game_dir / "Profile1.sav")
+    assert restored_content == b"dummy save", (
         f"Content should be restored but got: {restored_content}"
     )
 
 
+def test_restore_reuses_unchanged_live_files(patched_constants):
+    """Test that restore keeps matching live files and never links to the backup."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager
+
+    (game_dir / "Profile2.sav").write_text("second profile")
+    snap_path, _ = snapshot_manager.save(tags=["test"], note=None)
+
+    # Restoring twice: the second restore finds every live file unchanged
+    snapshot_manager.restore(snap_path)
+    live_ino = (game_dir / "Profile2.sav").stat().st_ino
+    (game_dir / "Profile1.sav").write_text("changed")
+    success, msg = snapshot_manager.restore(snap_path)
+    assert success, f"Restore should succeed but got: {msg}"
+
+    assert read_small(game_dir / "Profile1.sav") == b"dummy save"
+    assert (game_dir / "Profile2.sav").stat().st_ino == live_ino
+    for name in ("Profile1.sav", "Profile2.sav"):
+        assert (game_dir / name).stat().st_ino != (snap_path / name).stat().st_ino
+
+
+def test_restore_missing_snapshot_keeps_saves(patched_constants):
+    """Test that a failed restore leaves the live saves in place."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager
+
+    success, _ = snapshot_manager.restore(root / "test" / "missing")
+
+    assert not success
+    assert read_small(game_dir / "Profile1.sav") == b"dummy save"
+    leftovers = [p.name for p in game_dir.parent.iterdir() if p.name.startswith(".")]
+    assert leftovers == []
+
+
 def test_delete_snapshot_simple(patched_constants):
     """Test snapshot deletion."""
     root, game_dir = patched_constants
@@ -76,6 +112,20 @@ def test_delete_snapshot_simple(patched_constants):
     assert not snap_path.exists(), "Snapshot should not exist after deletion"
 
 
+def test_deleted_snapshot_leaves_listings(patched_constants):
+    """Test that a deleted snapshot and the trash never show up in listings."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager, tag_manager
+
+    snap_path, _ = snapshot_manager.save(tags=["test", "boss"], note=None)
+    snapshot_manager.delete_snapshot(snap_path)
+
+    assert snapshot_manager.list_snapshots() == []
+    assert tag_manager.list_tags() == ["boss", "test"]
+    assert tag_manager.get_snapshot_tag(snap_path) is None
+
+
 def test_save_error_handling(patched_constants):
     """Test error handling when game folder doesn't exist."""
     root, game_dir = patched_constants
@@ -92,3 +142,68 @@ def test_save_error_handling(patched_constants):
     assert "not found" in msg.lower() or "directory" in msg.lower(), (
         f"Error message should mention directory: {msg}"
     )
+
+
+def test_list_snapshots_sees_new_save(patched_constants):
+    """Test that the cached listing picks up snapshots saved after it."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager
+
+    snapshot_manager.save(tags=["test"], note="first")
+    assert len(snapshot_manager.list_snapshots()) == 1
+
+    snapshot_manager.save(tags=["test"], note="second")
+    assert len(snapshot_manager.list_snapshots()) == 2
+
+
+def test_save_with_multiple_tags(patched_constants):
+    """Test that a snapshot saved with several tags appears in each."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager, tag_manager
+
+    snap_path, msg = snapshot_manager.save(tags=["boss", "run", "boss"], note=None)
+    assert snap_path is not None, f"Save should succeed but got: {msg}"
+
+    for tag in ("boss", "run"):
+        assert tag_manager.snapshots_for_tag(tag) == [snap_path.name]
+    assert len(snapshot_manager.list_snapshots()) == 1
+
+
+def test_now_ts_sanitizes_note():
+    """Test that unsafe characters are stripped from the note suffix."""
+    from core import snapshot_manager
+
+    name = snapshot_manager.now_ts("Zagréus / Meg! v1.2_a-b  ")
+
+    assert name.endswith("_Zagréus  Meg v1.2_a-b")
+    assert "_" not in snapshot_manager.now_ts("///")
+
+
+def test_restore_sweeps_crashed_restore_leftovers(patched_constants):
+    """Test that restore deletes trees left by restores that crashed."""
+    root, game_dir = patched_constants
+
+    import subprocess
+    import sys
+
+    from core import file_ops, snapshot_manager
+
+    snap_path, _ = snapshot_manager.save(tags=["test"], note=None)
+
+    # A pid that no longer runs, and one that does (this test's parent)
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    leftovers = [f".hades_old_{'0' * 32}", f".hades_stage_{dead.pid}"]
+    running = f".hades_stage_{os.getppid()}"
+    for name in leftovers + [running]:
+        (game_dir.parent / name).mkdir()
+
+    success, msg = snapshot_manager.restore(snap_path)
+    assert success, f"Restore should succeed but got: {msg}"
+
+    # The reaper has one worker, so this runs after the queued deletions
+    file_ops._reaper.submit(lambda: None).result()
+    names = sorted(p.name for p in game_dir.parent.iterdir() if p.name.startswith("."))
+    assert names == [running]
@@ -1,5 +1,9 @@
 """Simple working tests for tag manager."""
 
+import pytest
+
+from .conftest import make_snaps, snap_names
+
 
 def test_add_tag_simple(patched_constants):
     """Test adding tags to snapshots."""
@@ -8,22 +12,16 @@ def test_add_tag_simple(patched_constants):
     from core import tag_manager
 
     # Create a source tag directory and snapshot
-    source_tag_dir = root / "source_tag"
-    source_tag_dir.mkdir()
-    snapshot_dir = source_tag_dir / "snapshot1"
-    snapshot_dir.mkdir()
-    (snapshot_dir / "mock_file.txt").write_text("mock content")
-    
-    # Add a tag
-    tag_manager.add_tag("test", snapshot_dir)
+    make_snaps(root / "source_tag", ["snapshot1"])
 
-    # Check tag directory was created
-    tag_dir = root / "test"
-    assert tag_dir.exists(), "Tag directory should be created"
+    # Add a tag
+    tag_manager.add_tag("test", root / "source_tag" / "snapshot1")
 
-    # Check snapshot exists in tag directory
-    snapshot_in_tag = tag_dir / "snapshot1"
-    assert snapshot_in_tag.exists(), "Snapshot should exist in tag directory"
+    # Check tag directory was created with the snapshot in it
+    assert "test" in snap_names(root), "Tag directory should be created"
+    assert snap_names(root / "test") == ["snapshot1"], (
+        "Snapshot should exist in tag directory"
+    )
 
 
 def test_list_tags_simple(patched_constants):
@@ -34,12 +32,8 @@ def test_list_tags_simple(patched_constants):
 
     # Create initial tag directories with snapshots
     for tag_name, snap_name in [("tag1", "snap1"), ("tag2", "snap2")]:
-        tag_dir = root / tag_name
-        tag_dir.mkdir()
-        snapshot_dir = tag_dir / snap_name
-        snapshot_dir.mkdir()
-        (snapshot_dir / "mock_file.txt").write_text("mock content")
-    
+        make_snaps(root / tag_name, [snap_name])
+
     # Add additional tags to existing snapshots
     tag_manager.add_tag("tag3", root / "tag1" / "snap1")
     tag_manager.add_tag("tag4", root / "tag2" / "snap2")
@@ -59,15 +53,8 @@ def test_snapshots_for_tag_simple(patched_constants):
 
     from core import tag_manager
 
-    # Create a tag directory and add snapshots to it
-    tag_dir = root / "test"
-    tag_dir.mkdir()
-
-    # Create snapshots in the tag directory
-    for snap_name in ["snap1", "snap2"]:
-        snapshot_dir = tag_dir / snap_name
-        snapshot_dir.mkdir()
-        (snapshot_dir / "mock_file.txt").write_text("mock content")
+    # Create a tag directory with snapshots in it
+    make_snaps(root / "test", ["snap1", "snap2"])
 
     # Get snapshots for tag
     snapshots = tag_manager.snapshots_for_tag("test")
@@ -82,15 +69,8 @@ def test_get_tag_count_simple(patched_constants):
 
     from core import tag_manager
 
-    # Create a tag directory and add snapshots to it
-    tag_dir = root / "test"
-    tag_dir.mkdir()
-
-    # Create snapshots in the tag directory
-    for snap_name in ["snap1", "snap2", "snap3"]:
-        snapshot_dir = tag_dir / snap_name
-        snapshot_dir.mkdir()
-        (snapshot_dir / "mock_file.txt").write_text("mock content")
+    # Create a tag directory with snapshots in it
+    make_snaps(root / "test", ["snap1", "snap2", "snap3"])
 
     # Get count
     count = tag_manager.get_tag_count("test")
@@ -105,12 +85,8 @@ def test_add_multiple_snapshots_to_tag(patched_constants):
 
     # Create source snapshots in different tag directories
     for i, snap_name in enumerate(["snap1", "snap2", "snap3"]):
-        tag_dir = root / f"source_tag_{i}"
-        tag_dir.mkdir()
-        snapshot_dir = tag_dir / snap_name
-        snapshot_dir.mkdir()
-        (snapshot_dir / "mock_file.txt").write_text("mock content")
-    
+        make_snaps(root / f"source_tag_{i}", [snap_name])
+
     # Add multiple snapshots to the same tag
     tag_manager.add_tag("multi", root / "source_tag_0" / "snap1")
     tag_manager.add_tag("multi", root / "source_tag_1" / "snap2")
@@ -137,3 +113,147 @@ def test_nonexistent_tag(patched_constants):
     # Get count for non-existent tag
     count = tag_manager.get_tag_count("nonexistent")
     assert count == 0, "Non-existent tag should have count 0"
+
+
+def test_create_tag_simple(patched_constants):
+    """Test creating an empty tag."""
+    root, game_dir = patched_constants
+
+    from core import tag_manager
+
+    assert tag_manager.list_tags() == []
+
+    success, msg = tag_manager.create_tag("boss")
+    assert success, f"Create should succeed but got: {msg}"
+    assert tag_manager.list_tags() == ["boss"]
+
+    success, msg = tag_manager.create_tag("boss")
+    assert not success, "Creating an existing tag should fail"
+
+
+def test_merge_tags_simple(patched_constants):
+    """Test merging one tag into another."""
+    root, game_dir = patched_constants
+
+    from core import tag_manager
+
+    for tag, snaps in (("source", ["snap1", "snap2"]), ("target", ["snap2", "snap3"])):
+        for snap in snaps:
+            (root / tag / snap).mkdir(parents=True)
+            (root / tag / snap / "Profile1.sav").write_text(f"{tag} {snap}")
+
+    success, msg = tag_manager.merge_tags("source", "target")
+    assert success, f"Merge should succeed but got: {msg}"
+
+    assert tag_manager.list_tags() == ["target"]
+    assert sorted(tag_manager.snapshots_for_tag("target")) == ["snap1", "snap2", "snap3"]
+    # Snapshots already in the target are kept as they were
+    assert (root / "target" / "snap2" / "Profile1.sav").read_text() == "target snap2"
+    assert (root / "target" / "snap1" / "Profile1.sav").read_text() == "source snap1"
+
+
+def test_delete_tag_simple(patched_constants):
+    """Test deleting a tag together with its snapshots."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager, tag_manager
+
+    make_snaps(root / "boss", ["snap1"])
+
+    success, msg = tag_manager.delete_tag("boss")
+    assert success, f"Delete should succeed but got: {msg}"
+    assert not (root / "boss").exists()
+    assert tag_manager.list_tags() == []
+    assert snapshot_manager.list_snapshots() == []
+
+    success, msg = tag_manager.delete_tag("boss")
+    assert not success, "Deleting a missing tag should fail"
+
+
+def test_tags_for_snapshot_simple(patched_constants):
+    """Test looking up the tags that hold a snapshot."""
+    root, game_dir = patched_constants
+
+    from core import tag_manager
+
+    make_snaps(root / "tag1", ["snap1"])
+    make_snaps(root / "tag2", ["snap1", "snap2"])
+
+    assert tag_manager.tags_for_snapshot("snap1") == ["tag1", "tag2"]
+    assert tag_manager.tags_for_snapshot("snap2") == ["tag2"]
+    assert tag_manager.tags_for_snapshot("missing") == []
+
+    tag_manager.add_tag("tag3", root / "tag2" / "snap2")
+    assert tag_manager.tags_for_snapshot("snap2") == ["tag2", "tag3"]
+
+
+def test_trash_name_is_not_a_tag(patched_constants):
+    """Test that the trash directory name is rejected everywhere a tag is named."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager, tag_manager
+
+    success, _ = tag_manager.create_tag(".trash")
+    assert not success, "The trash directory must not be created as a tag"
+
+    snap_path, msg = snapshot_manager.save(tags=[".trash"], note="keep me")
+    assert snap_path is None, f"Saving into the trash should fail but got: {msg}"
+
+    make_snaps(root / "boss", ["snap1"])
+    assert not tag_manager.rename_tag("boss", ".trash")[0]
+    assert not tag_manager.merge_tags("boss", ".trash")[0]
+    with pytest.raises(ValueError):
+        tag_manager.add_tags(["run", ".trash"], root / "boss" / "snap1")
+    assert tag_manager.list_tags() == ["boss"]
+    assert tag_manager.snapshots_for_tag("boss") == ["snap1"]
+    assert not (root / ".trash").exists()
+
+
+def test_rename_to_reserved_name_keeps_snapshots(patched_constants):
+    """Test that renaming a tag to a reserved name fails and hides nothing."""
+    root, game_dir = patched_constants
+
+    from core import snapshot_manager, tag_manager
+
+    make_snaps(root / "x", ["snap1"])
+
+    for reserved in ("tags", "saves", "config.json", "hades.log"):
+        success, _ = tag_manager.rename_tag("x", reserved)
+        assert not success, f"Renaming to '{reserved}' should fail"
+        assert not tag_manager.create_tag(reserved)[0]
+
+    assert tag_manager.list_tags() == ["x"]
+    assert [p.name for p in snapshot_manager.list_snapshots()] == ["snap1"]
+
+
+def test_trash_is_never_used_as_a_source_tag(patched_constants):
+    """Test that the trash can't be deleted, renamed or merged like a tag."""
+    root, game_dir = patched_constants
+
+    from core import tag_manager
+
+    make_snaps(root / ".trash", ["old-snap"])
+    make_snaps(root / "x", ["snap1"])
+
+    assert not tag_manager.delete_tag(".trash")[0]
+    assert not tag_manager.rename_tag(".trash", "y")[0]
+    assert not tag_manager.merge_tags(".trash", "x")[0]
+
+    assert snap_names(root / ".trash") == ["old-snap"]
+    assert snap_names(root / "x") == ["snap1"]
+    assert tag_manager.list_tags() == ["x"]
+
+
+def test_delete_tag_refuses_files(patched_constants):
+    """Test that deleting the config, the log or a stray file is refused."""
+    root, game_dir = patched_constants
+
+    from core import tag_manager
+
+    for name in ("config.json", "hades.log", "notes.txt"):
+        (root / name).write_text(name)
+
+        success, _ = tag_manager.delete_tag(name)
+        assert not success, f"Deleting '{name}' should fail"
+        assert (root / name).read_text() == name
+    assert not (root / ".trash").exists()
@@ -1,6 +1,12 @@
 """Color definitions for TUI."""
 
 import curses
+import re
+
+# Log levels that get their own color, found with one scan of the line.
+# Lines look like "[12:00:00] LEVEL: message", so the level is the first hit
+_LOG_LEVEL_RE = re.compile(r"ERROR|SUCCESS|WARNING")
+_LOG_LEVEL_COLORS = {"ERROR": "RED", "SUCCESS": "BLUE", "WARNING": "YELLOW"}
 
 
 class ColorPairs:
@@ -18,6 +24,20 @@ class ColorPairs:
     LOG = 9  # log messages (changed from cyan to purple)
 
 
+class ColorAttrs:
+    """Curses attributes for each color pair, filled in by init_colors().
+
+    Drawing code uses these instead of calling curses.color_pair() on every
+    frame.
+    """
+
+    CYAN = SELECTED = YELLOW = RED = BLUE = curses.A_NORMAL
+    ACTIVE_PANE = MAGENTA = ACTIVE_TAG = LOG = curses.A_NORMAL
+
+    # Pane headers, plain and for the active pane
+    HEADER = ACTIVE_HEADER = curses.A_NORMAL
+
+
 def init_colors() -> None:
     """Initialize color pairs for the TUI."""
     curses.start_color()
@@ -33,6 +53,19 @@ def init_colors() -> None:
     curses.init_pair(ColorPairs.ACTIVE_TAG, curses.COLOR_WHITE, curses.COLOR_BLUE)
     curses.init_pair(ColorPairs.LOG, curses.COLOR_MAGENTA, -1)  # Changed from cyan to magenta (purple-like)
 
+    # Resolve the attributes once; they don't change after this point
+    ColorAttrs.CYAN = curses.color_pair(ColorPairs.CYAN)
+    ColorAttrs.SELECTED = curses.color_pair(ColorPairs.SELECTED)
+    ColorAttrs.YELLOW = curses.color_pair(ColorPairs.YELLOW)
+    ColorAttrs.RED = curses.color_pair(ColorPairs.RED)
+    ColorAttrs.BLUE = curses.color_pair(ColorPairs.BLUE)
+    ColorAttrs.ACTIVE_PANE = curses.color_pair(ColorPairs.ACTIVE_PANE)
+    ColorAttrs.MAGENTA = curses.color_pair(ColorPairs.MAGENTA)
+    ColorAttrs.ACTIVE_TAG = curses.color_pair(ColorPairs.ACTIVE_TAG)
+    ColorAttrs.LOG = curses.color_pair(ColorPairs.LOG)
+    ColorAttrs.HEADER = ColorAttrs.CYAN | curses.A_BOLD
+    ColorAttrs.ACTIVE_HEADER = ColorAttrs.ACTIVE_PANE | curses.A_BOLD
+
 
 def get_log_color(log_line: str) -> int:
     """Get color for a log line based on its content.
@@ -43,11 +76,7 @@ def get_log_color(log_line: str) -> int:
     Returns:
         Color pair constant for the log line
     """
-    if "ERROR" in log_line:
-        return curses.color_pair(ColorPairs.RED)
-    elif "SUCCESS" in log_line:
-        return curses.color_pair(ColorPairs.BLUE)  # Changed from GREEN to BLUE
-    elif "WARNING" in log_line:
-        return curses.color_pair(ColorPairs.YELLOW)
-    else:
-        return curses.color_pair(ColorPairs.LOG)
+    match = _LOG_LEVEL_RE.search(log_line)
+    if match is None:
+        return ColorAttrs.LOG
+    return getattr(ColorAttrs, _LOG_LEVEL_COLORS[match.group()])
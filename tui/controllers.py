@@ -1,5 +1,6 @@
 """Input handling controllers for TUI."""
 
+import bisect
 from typing import Any
 
 import curses
@@ -61,35 +62,42 @@ class NavigationController(BaseController):
 class SnapshotController(BaseController):
     """Controller for snapshots pane operations."""
 
+    # Key -> (handler method, snapshots needed for the key to do anything).
+    # One dict lookup picks the handler, and unbound keys skip the listing
+    _ACTIONS = {
+        curses.KEY_UP: ("_select_previous", 1),
+        curses.KEY_DOWN: ("_select_next", 1),
+        ord("s"): ("_handle_save", 0),
+        ord("r"): ("_handle_restore", 1),
+        10: ("_handle_restore", 1),  # Enter - restore snapshot
+        13: ("_handle_restore", 1),
+        ord("d"): ("_handle_delete", 1),
+    }
+
     def handle_input(self, key: int) -> bool:
         """Handle snapshot-related input."""
+        action = self._ACTIONS.get(key)
+        if action is None:
+            return super().handle_input(key)
+
+        method, min_snapshots = action
         all_snapshots = core.list_snapshots()
         filtered_snapshots = self.state.get_filtered_snapshots(all_snapshots)
+        if len(filtered_snapshots) >= min_snapshots:
+            getattr(self, method)(filtered_snapshots)
+        return True
 
-        if key == curses.KEY_UP and filtered_snapshots:
-            self.state.snapshot_idx = max(0, self.state.snapshot_idx - 1)
-            return True
-        elif key == curses.KEY_DOWN and filtered_snapshots:
-            self.state.snapshot_idx = min(
-                len(filtered_snapshots) - 1, self.state.snapshot_idx + 1
-            )
-            return True
-        elif key == ord("s"):
-            self._handle_save()
-            return True
-        elif key == ord("r") and filtered_snapshots:
-            self._handle_restore(filtered_snapshots)
-            return True
-        elif key in (10, 13) and filtered_snapshots:  # Enter - restore snapshot
-            self._handle_restore(filtered_snapshots)
-            return True
-        elif key == ord("d") and filtered_snapshots:
-            self._handle_delete(filtered_snapshots)
-            return True
+    def _select_previous(self, filtered_snapshots: list) -> None:
+        """Move the selection up one snapshot."""
+        self.state.snapshot_idx = max(0, self.state.snapshot_idx - 1)
 
-        return super().handle_input(key)
+    def _select_next(self, filtered_snapshots: list) -> None:
+        """Move the selection down one snapshot."""
+        self.state.snapshot_idx = min(
+            len(filtered_snapshots) - 1, self.state.snapshot_idx + 1
+        )
 
-    def _handle_save(self) -> None:
+    def _handle_save(self, filtered_snapshots: list) -> None:
         """Handle save operation."""
         curses.curs_set(1)
         note = prompt(self.stdscr, 1, "Note: ")
@@ -137,33 +145,36 @@ class SnapshotController(BaseController):
 class TagController(BaseController):
     """Controller for tags pane operations."""
 
+    # Key -> (handler method, tags needed for the key to do anything)
+    _ACTIONS = {
+        curses.KEY_UP: ("_select_previous", 0),
+        curses.KEY_DOWN: ("_select_next", 0),
+        ord("\n"): ("_handle_enter", 0),
+        ord("n"): ("_handle_new_tag", 0),
+        ord("R"): ("_handle_rename_tag", 1),
+        ord("D"): ("_handle_delete_tag", 1),
+        ord("m"): ("_handle_merge_tags", 2),
+    }
+
     def handle_input(self, key: int) -> bool:
         """Handle tag-related input."""
+        action = self._ACTIONS.get(key)
+        if action is None:
+            return super().handle_input(key)
+
+        method, min_tags = action
         tags = core.list_tags()
+        if len(tags) >= min_tags:
+            getattr(self, method)(tags)
+        return True
 
-        if key == curses.KEY_UP:
-            self.state.tag_idx = max(0, self.state.tag_idx - 1)
-            return True
-        elif key == curses.KEY_DOWN:
-            self.state.tag_idx = min(len(tags), self.state.tag_idx + 1)
-            return True
-        elif key == ord("\n"):
-            self._handle_enter(tags)
-            return True
-        elif key == ord("n"):
-            self._handle_new_tag()
-            return True
-        elif key == ord("R") and tags:
-            self._handle_rename_tag(tags)
-            return True
-        elif key == ord("D") and tags:
-            self._handle_delete_tag(tags)
-            return True
-        elif key == ord("m") and len(tags) > 1:
-            self._handle_merge_tags(tags)
-            return True
+    def _select_previous(self, tags: list) -> None:
+        """Move the selection up one row."""
+        self.state.tag_idx = max(0, self.state.tag_idx - 1)
 
-        return super().handle_input(key)
+    def _select_next(self, tags: list) -> None:
+        """Move the selection down one row; row 0 is "+ New tag"."""
+        self.state.tag_idx = min(len(tags), self.state.tag_idx + 1)
 
     def _handle_enter(self, tags: list) -> None:
         """Handle enter key on tag selection."""
@@ -178,7 +189,7 @@ class TagController(BaseController):
             self.state.active_pane = 0
             self.state.snapshot_idx = 0
 
-    def _handle_new_tag(self) -> None:
+    def _handle_new_tag(self, tags: list) -> None:
         """Handle new tag creation."""
         self.state.creating_tag = True
         self.state.tag_input = ""
@@ -247,25 +258,41 @@ class TagController(BaseController):
 class TagInputController(BaseController):
     """Controller for tag input modes (creation/renaming)."""
 
+    # Editing keys -> handler method; any other printable key is typed
+    _ACTIONS = {
+        27: "_cancel_input",  # Esc
+        10: "_submit_input",  # Enter
+        13: "_submit_input",
+        curses.KEY_BACKSPACE: "_delete_last_char",
+        127: "_delete_last_char",
+        8: "_delete_last_char",
+    }
+
+    # Printable ASCII, typed into the tag name as is
+    _PRINTABLE = frozenset(range(32, 127))
+
     def handle_input(self, key: int) -> bool:
         """Handle tag input keys."""
-        if key in (27,):  # Esc
-            self._cancel_input()
-            return True
-        elif key in (10, 13):  # Enter
-            self._submit_input()
-            return True
-        elif key in (curses.KEY_BACKSPACE, 127, 8):
-            self.state.tag_input = self.state.tag_input[:-1]
+        method = self._ACTIONS.get(key)
+        if method is not None:
+            getattr(self, method)()
             return True
-        elif 32 <= key <= 126:  # Printable characters
+        elif key in self._PRINTABLE:
             self.state.tag_input += chr(key)
             return True
 
         return super().handle_input(key)
 
+    def _delete_last_char(self) -> None:
+        """Remove the last typed character."""
+        self.state.tag_input = self.state.tag_input[:-1]
+
     def _cancel_input(self) -> None:
         """Cancel tag input mode."""
+        self._reset_input()
+
+    def _reset_input(self) -> None:
+        """Leave tag input mode and clear the input field."""
         self.state.creating_tag = False
         self.state.renaming_tag = False
         self.state.tag_input = ""
@@ -280,29 +307,23 @@ class TagInputController(BaseController):
             elif self.state.renaming_tag:
                 self._rename_tag(name)
 
-        self.state.creating_tag = False
-        self.state.renaming_tag = False
-        self.state.tag_input = ""
-        curses.curs_set(0)
+        self._reset_input()
 
     def _create_tag(self, name: str) -> None:
         """Create a new tag."""
-        import core
-
-        # Use the core module to create the tag by creating an empty directory
-        tag_dir = core.BACKUP_SAVE_ROOT / name
-        
-        if tag_dir.exists():
-            self.state.set_error(f"Tag '{name}' already exists")
+        # list_tags() is sorted, so the new tag's row follows from the listing
+        # taken before the create, without scanning the backup root again
+        tags = core.list_tags()
+        result, message = core.create_tag(name)
+        if not result:
+            self.state.set_error(message)
         else:
-            tag_dir.mkdir(parents=True, exist_ok=True)
-            # Just create the directory - it will be used when snapshots are added
-            self.state.set_success(f"Created tag '{name}'")
+            self.state.set_success(message)
 
             # Auto-select newly created tag
             self.state.selected_tag = name
             core.set_last_tag(name)
-            self.state.tag_idx = core.list_tags().index(name) + 1
+            self.state.tag_idx = bisect.bisect_left(tags, name) + 1
 
     def _rename_tag(self, name: str) -> None:
         """Rename an existing tag."""
@@ -314,6 +335,9 @@ class TagInputController(BaseController):
                 if self.state.selected_tag == old_tag:
                     self.state.selected_tag = name
                     core.set_last_tag(name)
+                # Keep the renamed tag selected at its new sorted position
+                del tags[self.state.tag_idx - 1]
+                self.state.tag_idx = bisect.bisect_left(tags, name) + 1
                 self.state.set_success(message)
             else:
                 self.state.set_error(message)
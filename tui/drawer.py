@@ -1,12 +1,18 @@
 """Main drawing coordinator for TUI."""
 
+import re
 from typing import Any
 
 import curses
 import core
-from .colors import ColorPairs
+from .colors import ColorAttrs
 from .panes import MetadataPane, SnapshotPane, TagsPane
 
+# Words that mark a status message as a success rather than an error
+_SUCCESS_RE = re.compile(
+    r"success|created|restored|renamed|merged|deleted", re.IGNORECASE
+)
+
 
 class TUIDrawer:
     """Main drawing coordinator for the TUI."""
@@ -15,26 +21,39 @@ class TUIDrawer:
         self.snapshot_pane = None
         self.metadata_pane = None
         self.tags_pane = None
+        # Screen size the panes were last laid out for, and the pane widths
+        self._screen_size = None
+        self._pane_widths = (0, 0, 0)
 
     def draw(self, stdscr: Any, state: Any) -> None:
-        """Draw the entire TUI interface."""
-        stdscr.clear()
+        """Draw the entire TUI interface.
+
+        Only the virtual screen is updated; the caller flushes it with
+        curses.doupdate().
+        """
+        # erase() blanks the window without clear()'s forced full repaint,
+        # so the next update only sends the cells that actually changed
+        stdscr.erase()
         h, w = stdscr.getmaxyx()
 
-        # Calculate pane widths
-        snapshots_w = w // 3
-        metadata_w = w // 3
-        tags_w = w - snapshots_w - metadata_w - 4
+        # The layout only depends on the screen size, so the panes are only
+        # rebuilt when the terminal has been resized
+        if (h, w) != self._screen_size:
+            snapshots_w = w // 3
+            metadata_w = w // 3
+            tags_w = w - snapshots_w - metadata_w - 4
+            self.initialize_panes(snapshots_w, metadata_w, tags_w, h)
+            self._screen_size = (h, w)
+            self._pane_widths = (snapshots_w, metadata_w, tags_w)
+        snapshots_w, metadata_w, tags_w = self._pane_widths
 
         # Get data first
         all_snapshots = core.list_snapshots()
         filtered_snapshots = state.get_filtered_snapshots(all_snapshots)
         tags = core.list_tags()
 
-        # Initialize panes with correct dimensions
-        self.initialize_panes(snapshots_w, metadata_w, tags_w, h)
-
-        # Validate indexes
+        # Clamp the selections once per frame against what is on disk now;
+        # other processes can add or remove snapshots and tags between keys
         self.validate_indexes(state, filtered_snapshots, tags)
 
         # Draw pane headers
@@ -42,14 +61,11 @@ class TUIDrawer:
             stdscr, snapshots_w, metadata_w, tags_w, state.active_pane
         )
 
-        # Validate indexes
-        self.validate_indexes(state, filtered_snapshots, tags)
-
         # Draw content in each pane
         if self.snapshot_pane and self.metadata_pane and self.tags_pane:
             self.snapshot_pane.draw(stdscr, 0, state, filtered_snapshots)
             self.metadata_pane.draw(stdscr, snapshots_w + 3, state, filtered_snapshots)
-            self.tags_pane.draw(stdscr, snapshots_w + metadata_w + 4, state)
+            self.tags_pane.draw(stdscr, snapshots_w + metadata_w + 4, state, tags)
 
         # Draw help/status bar
         self.draw_help_bar(stdscr, h, w, state)
@@ -57,29 +73,22 @@ class TUIDrawer:
         # Draw status message (error/success)
         self.draw_status_message(stdscr, h, w, state)
 
+        stdscr.noutrefresh()
+
     def draw_status_message(self, stdscr: Any, h: int, w: int, state: Any) -> None:
         """Draw error or success message."""
         if state.error_message and state.error_timer > 0:
-            color = ColorPairs.RED
-            msg_lower = state.error_message.lower()
-            if any(
-                word in msg_lower
-                for word in [
-                    "success",
-                    "created",
-                    "restored",
-                    "renamed",
-                    "merged",
-                    "deleted",
-                ]
-            ):
-                color = ColorPairs.BLUE  # Changed from GREEN to BLUE
+            color = ColorAttrs.RED
+            # One case-insensitive scan instead of lowering the message and
+            # testing each word separately
+            if _SUCCESS_RE.search(state.error_message):
+                color = ColorAttrs.BLUE  # Changed from GREEN to BLUE
 
             stdscr.addstr(
                 h - 1,
                 2,
                 state.error_message[: w - 4],
-                curses.color_pair(color) | curses.A_BOLD,
+                color | curses.A_BOLD,
             )
 
     def draw_pane_headers(
@@ -92,29 +101,21 @@ class TUIDrawer:
     ) -> None:
         """Draw pane headers with active pane highlighting."""
         # Determine header colors
-        colors = [
-            curses.color_pair(ColorPairs.CYAN) | curses.A_BOLD,
-            curses.color_pair(ColorPairs.CYAN) | curses.A_BOLD,
-            curses.color_pair(ColorPairs.CYAN) | curses.A_BOLD,
-        ]
+        colors = [ColorAttrs.HEADER] * 3
 
         if 0 <= active_pane < 3:
-            colors[active_pane] = (
-                curses.color_pair(ColorPairs.ACTIVE_PANE) | curses.A_BOLD
-            )
+            colors[active_pane] = ColorAttrs.ACTIVE_HEADER
 
         # Draw headers
         stdscr.addstr(0, 2, "Snapshots", colors[0])
         stdscr.addstr(0, snapshots_w + 3, "Metadata", colors[1])
         stdscr.addstr(0, snapshots_w + metadata_w + 4, "Tags", colors[2])
 
-        # Draw vertical separators
+        # Draw vertical separators, one vline call per column instead of a
+        # cell-by-cell addch loop
         h, w = stdscr.getmaxyx()
-        vline = "│"
-
-        for y in range(1, h):
-            stdscr.addch(y, snapshots_w + 1, ord(vline))
-            stdscr.addch(y, snapshots_w + metadata_w + 2, ord(vline))
+        stdscr.vline(1, snapshots_w + 1, curses.ACS_VLINE, h - 1)
+        stdscr.vline(1, snapshots_w + metadata_w + 2, curses.ACS_VLINE, h - 1)
 
     def validate_indexes(
         self, state: Any, filtered_snapshots: list, tags: list
@@ -157,7 +158,7 @@ class TUIDrawer:
         help_text = self._add_context_info(help_text, state, w)
 
         stdscr.addstr(
-            help_y, 2, help_text[: w - 4], curses.color_pair(ColorPairs.BLUE)  # Changed from GREEN to BLUE
+            help_y, 2, help_text[: w - 4], ColorAttrs.BLUE  # Changed from GREEN to BLUE
         )
 
     def _add_context_info(self, help_text: str, state: Any, w: int) -> str:
@@ -1,12 +1,13 @@
 """Refactored TUI main module."""
 
 import curses
-from typing import Any
+from typing import Any, Dict, List
 
 import core
 
 from .colors import init_colors
 from .controllers import (
+    BaseController,
     NavigationController,
     SnapshotController,
     TagController,
@@ -15,41 +16,107 @@ from .controllers import (
 from .drawer import TUIDrawer
 from .ui_state import UIState
 
+# How often a visible status message ages by one frame while no key is pressed
+STATUS_TICK_MS = 300
+
+# Keys that work the same in every pane
+NAVIGATION_KEYS = frozenset((9, curses.KEY_LEFT, curses.KEY_RIGHT, ord("q")))
+
 
 def main(stdscr: Any) -> None:
     """Main TUI application loop."""
     curses.curs_set(0)
     stdscr.keypad(True)
+    # Let ncurses use the terminal's insert/delete line operations when
+    # whole rows shift, instead of repainting them cell by cell
+    stdscr.idlok(True)
 
     init_colors()
 
     state = UIState()
     drawer = TUIDrawer()
 
+    # Controllers only hold the screen and the state, so one of each serves
+    # the whole session
+    controllers = {
+        "navigation": NavigationController(stdscr, state),
+        "snapshots": SnapshotController(stdscr, state),
+        "tags": TagController(stdscr, state),
+        "tag_input": TagInputController(stdscr, state),
+    }
+
     # Initialize with last used tag logic
     _initialize_tag_selection(state)
 
     while True:
         drawer.draw(stdscr, state)
-        key = stdscr.getch()
-
-        # Handle tag input mode (overrides everything)
-        if state.creating_tag or state.renaming_tag:
-            controller = TagInputController(stdscr, state)
-            if controller.handle_input(key):
-                continue  # Input handled, continue loop
-            else:
-                break  # Quit signal
-
-        # Handle regular input based on active pane
-        controller = _get_controller_for_pane(stdscr, state, key)
-        result = controller.handle_input(key) if controller else True
-        if result is False:  # Quit signal
-            break
-
-        # Decrease error message timer
-        if state.error_timer > 0:
-            state.error_timer -= 1
+        curses.doupdate()
+
+        # Wake up periodically only while a status message is on screen, so
+        # it expires even when idle; otherwise block until a key arrives
+        key = _read_key(stdscr, STATUS_TICK_MS if state.error_timer > 0 else -1)
+        if key == -1:
+            if state.error_timer > 0:
+                state.error_timer -= 1
+            continue
+
+        # Handle every key that is already waiting (a held arrow key, a
+        # pasted tag name) before drawing again, so the screen is redrawn
+        # once per burst of input instead of once per key
+        while key != -1:
+            if not _handle_key(controllers, state, key):
+                return
+            key = _read_key(stdscr, 0)
+            if key != -1:
+                # No frame is drawn between these keys, so clamp the
+                # selection as the drawer would; the last key may have
+                # deleted or merged the tags it pointed at
+                _clamp_selection(drawer, state)
+
+
+def _clamp_selection(drawer: TUIDrawer, state: UIState) -> None:
+    """Clamp the selections against the snapshots and tags on disk now."""
+    filtered_snapshots = state.get_filtered_snapshots(core.list_snapshots())
+    drawer.validate_indexes(state, filtered_snapshots, core.list_tags())
+
+
+def _handle_key(
+    controllers: Dict[str, BaseController], state: UIState, key: int
+) -> bool:
+    """Handle one key press.
+
+    Returns:
+        False if the key asked to quit, True otherwise
+    """
+    # Handle tag input mode (overrides everything)
+    if state.creating_tag or state.renaming_tag:
+        return controllers["tag_input"].handle_input(key)
+
+    # Handle regular input based on active pane
+    controller = _get_controller_for_pane(controllers, state, key)
+    result = controller.handle_input(key) if controller else True
+    if result is False:  # Quit signal
+        return False
+
+    # Decrease error message timer
+    if state.error_timer > 0:
+        state.error_timer -= 1
+    return True
+
+
+def _read_key(stdscr: Any, delay_ms: int) -> int:
+    """Get a key, waiting at most delay_ms (-1 waits forever).
+
+    Returns:
+        The key code, or -1 if no key arrived in time
+    """
+    # Blocking is restored right after this read: controllers prompt with
+    # blocking getstr/getch calls of their own
+    stdscr.timeout(delay_ms)
+    try:
+        return stdscr.getch()
+    finally:
+        stdscr.timeout(-1)
 
 
 def _initialize_tag_selection(state: UIState) -> None:
@@ -64,41 +131,35 @@ def _initialize_tag_selection(state: UIState) -> None:
             state.selected_tag = None
     elif not state.selected_tag and all_snapshots:
         # No last tag selected, try to find the most recently used tag
-        tags = core.list_tags()
-        if tags:
-            latest_tag = _find_latest_tag(tags)
-            if latest_tag:
-                state.selected_tag = latest_tag
+        latest_tag = _find_latest_tag(all_snapshots)
+        if latest_tag:
+            state.selected_tag = latest_tag
 
 
-def _find_latest_tag(tags: list) -> str | None:
+def _find_latest_tag(all_snapshots: List[core.Path]) -> str | None:
     """Find the tag with the most recent snapshot."""
-    latest_tag = None
-    latest_time = None
-
-    for tag in tags:
-        tag_snapshots = core.snapshots_for_tag(tag)
-        if tag_snapshots:
-            latest_snapshot = sorted(tag_snapshots)[-1]
-            if latest_time is None or latest_snapshot > latest_time:
-                latest_time = latest_snapshot
-                latest_tag = tag
-
-    return latest_tag
-
-
-def _get_controller_for_pane(stdscr: Any, state: UIState, key: int) -> Any:
+    # list_snapshots() is newest first, so the tags holding its first entry
+    # are the ones with the most recent snapshot. tags_for_snapshot() is
+    # sorted like list_tags(), so on a tie the first tag in the list wins
+    if not all_snapshots:
+        return None
+    tags = core.tags_for_snapshot(all_snapshots[0].name)
+    return tags[0] if tags else None
+
+
+def _get_controller_for_pane(
+    controllers: Dict[str, BaseController], state: UIState, key: int
+) -> BaseController:
     """Get appropriate controller based on active pane."""
     # Navigation controller handles keys that work in any pane
-    nav_controller = NavigationController(stdscr, state)
-    if key in (9, curses.KEY_LEFT, curses.KEY_RIGHT, ord("q")):
-        return nav_controller
+    if key in NAVIGATION_KEYS:
+        return controllers["navigation"]
 
     # Pane-specific controllers
     if state.active_pane == 0:
-        return SnapshotController(stdscr, state)
+        return controllers["snapshots"]
     elif state.active_pane == 2:
-        return TagController(stdscr, state)
+        return controllers["tags"]
     else:
         # Metadata pane has no specific controller
-        return nav_controller
+        return controllers["navigation"]
@@ -4,7 +4,7 @@ from typing import List, Any
 
 import curses
 import core
-from .colors import ColorPairs
+from .colors import ColorAttrs
 
 
 class BasePane:
@@ -30,7 +30,8 @@ class SnapshotPane(BasePane):
         snapshots: List[core.Path] | None = None,
     ) -> None:
         """Draw the snapshots list pane."""
-        max_y = self.height - 3  # Leave space for header and help
+        # Rows 2 .. height-3; the help bar and status line use the last two
+        max_y = self.height - 4
 
         if not snapshots:
             self._draw_empty_state(stdscr, offset_x, state)
@@ -45,14 +46,14 @@ class SnapshotPane(BasePane):
                 2,
                 offset_x + 2,
                 f"No snapshots with tag '{state.selected_tag}'",
-                curses.color_pair(ColorPairs.RED),
+                ColorAttrs.RED,
             )
         else:
             stdscr.addstr(
                 2,
                 offset_x + 2,
                 "No snapshots available",
-                curses.color_pair(ColorPairs.RED),
+                ColorAttrs.RED,
             )
 
     def _draw_snapshot_list(
@@ -64,16 +65,43 @@ class SnapshotPane(BasePane):
         max_y: int,
     ) -> None:
         """Draw the list of snapshots."""
-        for i, snap in enumerate(snapshots[:max_y]):
-            y = 2 + i
-            attr = self._get_snapshot_attr(i, state)
-            text = snap.name.ljust(self.width - 4)
-            stdscr.addstr(y, offset_x + 2, text, attr)
+        top = self._scroll_to_selection(state, len(snapshots), max_y)
+        row_w = self.width - 4
+        x = offset_x + 2
+        # Only the selected row is highlighted, so its attribute is looked
+        # up once and the loop body just compares indexes
+        selected = state.snapshot_idx
+        selected_attr = self._get_snapshot_attr(selected, state)
+        normal = curses.A_NORMAL
+        addnstr = stdscr.addnstr
+        for y, snap in enumerate(snapshots[top : top + max_y], start=2):
+            if y - 2 + top == selected:
+                addnstr(y, x, snap.name, row_w, selected_attr)
+                # Paint the highlight across the whole row, not just the name
+                stdscr.chgat(y, x, row_w, selected_attr)
+            else:
+                addnstr(y, x, snap.name, row_w, normal)
+
+    def _scroll_to_selection(self, state: Any, count: int, rows: int) -> int:
+        """Move the viewport just enough to keep the selected row visible.
+
+        Returns:
+            Index of the first snapshot to show
+        """
+        top = state.snapshot_scroll
+        if state.snapshot_idx < top:
+            top = state.snapshot_idx
+        elif state.snapshot_idx >= top + rows:
+            top = state.snapshot_idx - rows + 1
+        # Don't leave empty rows at the bottom once the list has shrunk
+        top = max(0, min(top, count - rows))
+        state.snapshot_scroll = top
+        return top
 
     def _get_snapshot_attr(self, index: int, state: Any) -> int:
         """Get attribute for snapshot row based on selection state."""
         if index == state.snapshot_idx and state.active_pane == 0:
-            return curses.color_pair(ColorPairs.SELECTED)  # Active row in active pane
+            return ColorAttrs.SELECTED  # Active row in active pane
         elif index == state.snapshot_idx:
             return curses.A_REVERSE  # Selected row but not active pane
         else:
@@ -92,54 +120,68 @@ class MetadataPane(BasePane):
                 2,
                 offset_x + 2,
                 "No snapshots available",
-                curses.color_pair(ColorPairs.RED),
+                ColorAttrs.RED,
             )
             return
 
         snap = snapshots[state.snapshot_idx]
         meta = core.read_meta(snap)
-        tag_name = core.get_snapshot_tag(snap)  # Get the tag directory name
+        # The cached snapshot -> tags index saves a scan of every tag
+        # directory per frame; names are sorted, so the folder shown is stable
+        tag_names = core.tags_for_snapshot(snap.name)
+        tag_name = tag_names[0] if tag_names else None
         self._draw_metadata_content(stdscr, offset_x, meta, tag_name)
 
     def _draw_metadata_content(self, stdscr: Any, offset_x: int, meta: dict, tag_name: str = None) -> None:
         """Draw the actual metadata content."""
         y = 2
+        # addnstr stops at the pane edge, so long values never spill
+        # into the tags pane and need no slicing first
+        row_w = self.width - 4
 
         # Created date
-        stdscr.addstr(
+        stdscr.addnstr(
             y,
             offset_x + 2,
             f"Created: {meta.get('created_at', '')}",
-            curses.color_pair(ColorPairs.YELLOW),
+            row_w,
+            ColorAttrs.YELLOW,
         )
 
         # Show tag/folder name instead of tags
         y += 2
-        if tag_name:
-            stdscr.addstr(
-                y, offset_x + 2, f"Folder: {tag_name}", curses.color_pair(ColorPairs.MAGENTA)
-            )
-        else:
-            stdscr.addstr(
-                y, offset_x + 2, f"Folder: untagged", curses.color_pair(ColorPairs.MAGENTA)
-            )
+        stdscr.addnstr(
+            y,
+            offset_x + 2,
+            f"Folder: {tag_name or 'untagged'}",
+            row_w,
+            ColorAttrs.MAGENTA,
+        )
 
         # Note
         y += 2
         stdscr.addstr(y, offset_x + 2, "Note:", curses.A_BOLD)
         y += 1
 
-        note_lines = (meta.get("note") or "").splitlines()[: self.height - 7]
-        for line in note_lines:
-            if y < self.height - 2:
-                stdscr.addstr(y, offset_x + 4, line[: self.width - 6])
-                y += 1
+        # Stop at the last row above the help bar instead of checking the
+        # row for every line. The bounded split only breaks off the lines
+        # that fit, so a long note isn't split in full every frame
+        rows = max(0, self.height - 2 - y)
+        for line in (meta.get("note") or "").split("\n", rows)[:rows]:
+            stdscr.addnstr(y, offset_x + 4, line.rstrip("\r"), self.width - 6)
+            y += 1
 
 
 class TagsPane(BasePane):
     """Pane for managing tags."""
 
-    def draw(self, stdscr: Any, offset_x: int, state: Any) -> None:
+    def draw(
+        self,
+        stdscr: Any,
+        offset_x: int,
+        state: Any,
+        tags: List[str] | None = None,
+    ) -> None:
         """Draw the tags management pane."""
         max_y = self.height - 3
 
@@ -148,7 +190,9 @@ class TagsPane(BasePane):
             self._draw_tag_input(stdscr, offset_x, state)
             return
 
-        tags = core.list_tags()
+        # The drawer passes in the tags it already listed for this frame
+        if tags is None:
+            tags = core.list_tags()
         if not tags:
             self._draw_empty_tags_state(stdscr, offset_x)
             return
@@ -165,54 +209,55 @@ class TagsPane(BasePane):
 
         stdscr.addstr(2, offset_x + 2, prompt_text, curses.A_BOLD)
         input_field = state.tag_input + "_"
-        stdscr.addstr(
-            3,
-            offset_x + 2,
-            input_field.ljust(self.width - 4),
-            curses.color_pair(ColorPairs.SELECTED),
-        )
+        attr = ColorAttrs.SELECTED
+        stdscr.addnstr(3, offset_x + 2, input_field, self.width - 4, attr)
+        stdscr.chgat(3, offset_x + 2, self.width - 4, attr)
         stdscr.addstr(
             5,
             offset_x + 2,
             "[Enter] confirm  [Esc] cancel",
-            curses.color_pair(ColorPairs.BLUE),  # Changed from GREEN to BLUE
+            ColorAttrs.BLUE,  # Changed from GREEN to BLUE
         )
 
     def _draw_empty_tags_state(self, stdscr: Any, offset_x: int) -> None:
         """Draw empty tags state with hint."""
         stdscr.addstr(
-            2, offset_x + 2, "No tags available", curses.color_pair(ColorPairs.RED)
+            2, offset_x + 2, "No tags available", ColorAttrs.RED
         )
         stdscr.addstr(
             4,
             offset_x + 2,
             "Press [n] to create a tag",
-            curses.color_pair(ColorPairs.BLUE),  # Changed from GREEN to BLUE
+            ColorAttrs.BLUE,  # Changed from GREEN to BLUE
         )
 
     def _draw_tags_list(
         self, stdscr: Any, offset_x: int, state: Any, tags: List[str], max_y: int
     ) -> None:
         """Draw the list of tags."""
-        display_tags = ["+ New tag"] + tags
-
-        for i, item in enumerate(display_tags[:max_y]):
-            y = 2 + i
-            is_selected = i == state.tag_idx and state.active_pane == 2
+        if max_y <= 0:
+            return
 
-            if item == "+ New tag":
-                self._draw_new_tag_item(stdscr, offset_x, y, is_selected)
-            else:
-                self._draw_tag_item(stdscr, offset_x, y, item, state, is_selected)
+        # Row 0 is the "+ New tag" item and tags follow it, so only the tags
+        # that fit are sliced off instead of copying the whole list behind it
+        is_active_pane = state.active_pane == 2
+        self._draw_new_tag_item(
+            stdscr, offset_x, 2, is_active_pane and state.tag_idx == 0
+        )
+        for i, tag in enumerate(tags[: max_y - 1], start=1):
+            is_selected = is_active_pane and i == state.tag_idx
+            self._draw_tag_item(stdscr, offset_x, 2 + i, tag, state, is_selected)
 
     def _draw_new_tag_item(
         self, stdscr: Any, offset_x: int, y: int, is_selected: bool
     ) -> None:
         """Draw the 'New tag' virtual item."""
-        attr = curses.color_pair(ColorPairs.BLUE)  # Changed from GREEN to BLUE
+        attr = ColorAttrs.BLUE  # Changed from GREEN to BLUE
         if is_selected:
             attr |= curses.A_REVERSE
-        stdscr.addstr(y, offset_x + 2, "+ New tag".ljust(self.width - 4), attr)
+        stdscr.addnstr(y, offset_x + 2, "+ New tag", self.width - 4, attr)
+        if is_selected:
+            stdscr.chgat(y, offset_x + 2, self.width - 4, attr)
 
     def _draw_tag_item(
         self,
@@ -228,13 +273,13 @@ class TagsPane(BasePane):
         is_active = tag == state.selected_tag
 
         if is_selected:
-            color = curses.color_pair(
-                ColorPairs.ACTIVE_TAG if is_active else ColorPairs.SELECTED
-            )
+            color = ColorAttrs.ACTIVE_TAG if is_active else ColorAttrs.SELECTED
         elif is_active:
-            color = curses.color_pair(ColorPairs.MAGENTA) | curses.A_REVERSE
+            color = ColorAttrs.MAGENTA | curses.A_REVERSE
         else:
             color = curses.A_NORMAL
 
-        text = f"{tag} ({count})".ljust(self.width - 4)
-        stdscr.addstr(y, offset_x + 2, text, color)
+        stdscr.addnstr(y, offset_x + 2, f"{tag} ({count})", self.width - 4, color)
+        if color != curses.A_NORMAL:
+            # Paint the highlight across the whole row, not just the label
+            stdscr.chgat(y, offset_x + 2, self.width - 4, color)
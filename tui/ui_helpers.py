@@ -3,6 +3,8 @@
 import curses
 from typing import Any
 
+from .colors import ColorAttrs
+
 
 def prompt(stdscr: Any, y: int, msg: str) -> str:
     """Display a prompt and get user input.
@@ -15,10 +17,8 @@ def prompt(stdscr: Any, y: int, msg: str) -> str:
     Returns:
         User input string
     """
-    from .colors import ColorPairs
-
     curses.echo()
-    stdscr.addstr(y, 2, msg, curses.color_pair(ColorPairs.YELLOW))
+    stdscr.addstr(y, 2, msg, ColorAttrs.YELLOW)
     stdscr.clrtoeol()
     val = stdscr.getstr(y, 2 + len(msg)).decode()
     curses.noecho()
@@ -36,8 +36,6 @@ def confirm(stdscr: Any, title: str, msg: str) -> bool:
     Returns:
         True if user confirms, False otherwise
     """
-    from .colors import ColorPairs
-
     h, w = stdscr.getmaxyx()
     win_h, win_w = 7, max(len(msg) + 6, 44)
 
@@ -49,25 +47,31 @@ def confirm(stdscr: Any, title: str, msg: str) -> bool:
     )
     win.keypad(True)
 
+    # The frame, title and message never change, so draw them once
+    win.box()
+    win.addstr(1, 2, title, ColorAttrs.RED | curses.A_BOLD)
+    win.addstr(3, 2, msg)
+
     selected = 0  # 0 = Yes, 1 = No
+    redraw = True
 
     while True:
-        win.clear()
-        win.box()
-        win.addstr(1, 2, title, curses.color_pair(ColorPairs.RED) | curses.A_BOLD)
-        win.addstr(3, 2, msg)
-
-        yes_attr = curses.A_REVERSE if selected == 0 else curses.A_NORMAL
-        no_attr = curses.A_REVERSE if selected == 1 else curses.A_NORMAL
+        # Only the buttons change, and only when the selection moves
+        if redraw:
+            yes_attr = curses.A_REVERSE if selected == 0 else curses.A_NORMAL
+            no_attr = curses.A_REVERSE if selected == 1 else curses.A_NORMAL
 
-        win.addstr(5, 8, " Yes ", yes_attr | curses.color_pair(ColorPairs.BLUE))
-        win.addstr(5, 16, " No ", no_attr | curses.color_pair(ColorPairs.BLUE))
-        win.refresh()
+            win.addstr(5, 8, " Yes ", yes_attr | ColorAttrs.BLUE)
+            win.addstr(5, 16, " No ", no_attr | ColorAttrs.BLUE)
+            win.noutrefresh()
+            curses.doupdate()
+            redraw = False
 
         k = win.getch()
 
         if k in (curses.KEY_LEFT, curses.KEY_RIGHT):
             selected = 1 - selected
+            redraw = True
         elif k in (10, 13):  # Enter
             return selected == 0
         elif k in (27,):  # Esc
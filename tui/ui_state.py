@@ -3,6 +3,7 @@
 from typing import List
 
 import core
+from core.constants import ERROR_DISPLAY_DURATION
 
 
 class UIState:
@@ -11,6 +12,7 @@ class UIState:
     def __init__(self) -> None:
         self.active_pane = 0  # 0=snapshots, 1=metadata, 2=tags
         self.snapshot_idx = 0
+        self.snapshot_scroll = 0  # First snapshot row shown in the pane
         self.tag_idx = 0
         self.selected_tag = core.get_last_tag()
         self.creating_tag = False
@@ -32,7 +34,8 @@ class UIState:
         if not self.selected_tag:
             return all_snapshots
 
-        tagged_snapshots = core.snapshots_for_tag(self.selected_tag)
+        # A set makes each membership test O(1) instead of a list scan
+        tagged_snapshots = set(core.snapshots_for_tag(self.selected_tag))
         return [s for s in all_snapshots if s.name in tagged_snapshots]
 
     def set_error(self, message: str) -> None:
@@ -41,8 +44,6 @@ class UIState:
         Args:
             message: Error message to display
         """
-        from core.constants import ERROR_DISPLAY_DURATION
-
         self.error_message = message
         self.error_timer = ERROR_DISPLAY_DURATION
 
@@ -52,7 +53,5 @@ class UIState:
         Args:
             message: Success message to display
         """
-        from core.constants import ERROR_DISPLAY_DURATION
-
         self.error_message = message
         self.error_timer = ERROR_DISPLAY_DURATION